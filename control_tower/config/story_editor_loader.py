@@ -4,7 +4,6 @@ Loads configuration from JSON and provides helper functions
 """
 
 import json
-import os
 from PyQt5.QtGui import QFont
 from config.app_paths import get_story_editor_config_path
 
@@ -62,13 +61,18 @@ def get_text_editor_font():
     return font
 
 
-def get_tspan_editor_stylesheet():
-    """Get the stylesheet for TSpan text editors"""
+def get_tspan_editor_stylesheet(selector="QTextEdit"):
+    """Get the stylesheet for TSpan text editors
+
+    Args:
+        selector: Selector for the text editors, e.g. scoped by a container's
+                  object name when the sheet is set on an ancestor widget
+    """
     tspan = _config["tspan"]
     tooltip = _config["tooltip"]
 
     return f"""
-        QTextEdit {{
+        {selector} {{
             background-color: {tspan['background_color']};
             color: {tspan['text_color']};
             font-size: {tspan['font_size']}px;
@@ -79,7 +83,7 @@ def get_tspan_editor_stylesheet():
             selection-color: {tspan['selection_text_color']};
         }}
 
-        QTextEdit:focus {{
+        {selector}:focus {{
             border: 2px solid {tspan['focus_border_color']};
         }}
 
@@ -238,12 +242,17 @@ def get_toolbar_stylesheet():
     """
 
 
-def get_activate_button_disabled_stylesheet():
-    """Get the stylesheet for disabled activate buttons"""
+def get_activate_button_disabled_stylesheet(selector="QPushButton"):
+    """Get the stylesheet for disabled activate buttons
+
+    Args:
+        selector: Selector for the buttons, e.g. scoped by a property when the
+                  sheet is set on an ancestor widget
+    """
     btn = _config["activate_button"]
 
     return f"""
-        QPushButton {{
+        {selector} {{
             padding-top: 2px;
             padding-bottom: 2px;
             padding-left: 2px;
@@ -258,12 +267,17 @@ def get_activate_button_disabled_stylesheet():
     """
 
 
-def get_activate_button_stylesheet():
-    """Get the stylesheet for active activate buttons"""
+def get_activate_button_stylesheet(selector="QPushButton"):
+    """Get the stylesheet for active activate buttons
+
+    Args:
+        selector: Selector for the buttons, e.g. scoped by a property when the
+                  sheet is set on an ancestor widget
+    """
     btn = _config["activate_button"]
 
     return f"""
-        QPushButton {{
+        {selector} {{
             text-align: center;
             padding-top: 2px;
             padding-bottom: 2px;
@@ -275,16 +289,16 @@ def get_activate_button_stylesheet():
             background-color: {btn['bg']};
             color: {btn['color']};
         }}
-        QPushButton:checked {{
+        {selector}:checked {{
             background-color: {btn['checked_bg']};
             color: {btn['checked_color']};
         }}
     """
 
 
-def get_thumbnail_status_label_disabled_stylesheet():
+def get_thumbnail_status_label_disabled_stylesheet(selector="QLabel"):
     return f"""
-        QLabel {{
+        {selector} {{
             border: 2px solid #555; 
             font-weight: bold;
             font-size: 14px;
@@ -295,9 +309,9 @@ def get_thumbnail_status_label_disabled_stylesheet():
     """
 
 
-def get_thumbnail_status_label_stylesheet():
+def get_thumbnail_status_label_stylesheet(selector="QLabel"):
     return f"""
-        QLabel {{
+        {selector} {{
             border: 2px solid #555; 
             font-weight: bold;
             font-size: 14px;
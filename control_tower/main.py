@@ -11,13 +11,15 @@ from PyQt5.QtWidgets import (
     QDialog,
 )
 from PyQt5.QtNetwork import QLocalSocket, QLocalServer
-from PyQt5.QtCore import QTimer, Qt
+from PyQt5.QtCore import QThreadPool, QTimer, Qt
 from PyQt5.QtGui import QFont, QFontDatabase, QIcon
 
 from config.template_manager import show_template_manager
 from config.config_dialog import ConfigDialog
 from story_editor import StoryEditorWindow, StoryEditorParentWindow
 from story_editor.utils.reorder import reorder_krita_files
+from story_editor.utils.background_jobs import RequestEncodeJob, encode_request
+from collections import deque
 import json
 import sys
 import os
@@ -55,6 +57,10 @@ class ControlTower(QMainWindow):
         self.socket.readyRead.connect(self.on_data_received)
         self.socket.errorOccurred.connect(self.on_error)
 
+        # Requests waiting to be written, in send order: [action, bytes or None
+        # while a RequestEncodeJob is still encoding it]
+        self._outgoing_requests = deque()
+
         # UI Setup
         central_widget = QWidget()
         self.setCentralWidget(central_widget)
@@ -338,17 +344,52 @@ class ControlTower(QMainWindow):
     def send_request(self, action, **params):
         """Send a request to the Krita docker"""
         request = {"action": action, **params}
-        json_data = json.dumps(request)
-        self.log(f"📤 Sending Request to the Agent: {request['action']}")
-        self.socket.write(json_data.encode("utf-8"))
+        # Encoded in one expression so the JSON str is freed before the write
+        self._outgoing_requests.append([action, encode_request(request)])
+        self._write_outgoing_requests()
+
+    def send_request_in_background(self, action, **params):
+        """Send a large request to the Krita docker, encoding it on a worker thread.
+
+        The request is written once encoded, still after any request sent
+        before it and before any sent after it.
+        """
+        request = {"action": action, **params}
+        entry = [action, None]
+        self._outgoing_requests.append(entry)
+
+        job = RequestEncodeJob(request)
+        job.signals.encoded.connect(
+            lambda finished_job: self._on_request_encoded(entry, finished_job)
+        )
+        QThreadPool.globalInstance().start(job)
+
+    def _on_request_encoded(self, entry, job):
+        """Store an encoded request and write whatever is ready in order."""
+        if job.error is not None:
+            self.log(f"❌ Failed to encode request {entry[0]}: {job.error}")
+            self._outgoing_requests.remove(entry)
+        else:
+            entry[1] = job.data
+        self._write_outgoing_requests()
+
+    def _write_outgoing_requests(self):
+        """Write queued requests until one that is still being encoded."""
+        while self._outgoing_requests and self._outgoing_requests[0][1] is not None:
+            action, data = self._outgoing_requests.popleft()
+            self.log(f"📤 Sending Request to the Agent: {action}")
+            self.socket.write(data)
         self.socket.flush()
 
     def on_data_received(self):
         """Handle data received from the Krita docker"""
-        data = self.socket.readAll().data().decode("utf-8")
+        data = self.socket.readAll().data()
 
         try:
+            # json decodes the UTF-8 bytes itself; the payload is dropped right
+            # away so it is not kept alive while the response is handled
             response = json.loads(data)
+            del data
 
             # Determine response type and handle accordingly
             match response:
@@ -1,9 +1,22 @@
-from pathlib import Path
+import hashlib
 import os
-from dataclasses import dataclass, field
-from typing import List, Dict, Any, Optional
-from PyQt5.QtWidgets import QHBoxLayout, QLabel, QMenu, QAction, QTextEdit, QPushButton
-from PyQt5.QtCore import QTimer
+import sys
+import time
+from dataclasses import dataclass
+from typing import Callable, List, Dict, Any, Optional, Tuple
+from PyQt5.QtWidgets import (
+    QButtonGroup,
+    QHBoxLayout,
+    QLabel,
+    QMenu,
+    QPushButton,
+    QScrollBar,
+    QWidget,
+)
+from PyQt5.QtCore import Qt, QThreadPool, QTimer
+from PyQt5.QtGui import QFontMetrics, QPixmap
+from story_editor.utils.background_jobs import SvgParseJob, ThumbnailDecodeJob
+from story_editor.utils.svg_parser import parsed_svg_cache_key
 from story_editor.utils.text_updater import create_svg_data_for_doc
 from story_editor.widgets.find_replace import show_find_replace_dialog
 from story_editor.widgets.story_board_window import StoryBoardWindow
@@ -12,56 +25,48 @@ from story_editor.widgets.new_text_edit import add_new_text_widget
 # Import UI component factory functions from modular package
 from story_editor.ui_components import scroll_areas as ui_scroll
 from story_editor.ui_components import document as ui_doc
+from story_editor.ui_components import thumbnail as ui_thumb
+from story_editor.ui_components.text_editor import EditorModificationTracker
 
 from config.story_editor_loader import (
+    get_text_editor_font,
     get_thumbnail_right_click_menu_stylesheet,
 )
 
 # UI Constants (minimal - most moved to ui_components modules)
 MAIN_LAYOUT_MARGINS = (0, 0, 10, 0)
-
-
-@dataclass
-class LayerChange:
-    """Represents a change to a text element in a layer."""
-
-    new_text: QTextEdit
-    shape_id: str
-
-
-@dataclass
-class LayerGroup:
-    """Represents a layer group within a document."""
-
-    layer_name: str
-    layer_id: str
-    layer_shapes: List[Dict[str, Any]]
-    svg_content: str
-    changes: List[LayerChange] = field(default_factory=list)
-
-
-@dataclass
-class TextEditWidget:
-    """Represents a text editor widget with metadata."""
-
-    widget: QTextEdit
-    document_name: str
-    layer_name: str
-    layer_id: str
-    shape_id: str
-
-
-@dataclass
-class DocumentState:
-    """Represents the state of a document in the editor."""
-
-    document_name: str
-    document_path: str
-    has_text_changes: bool = False
-    new_text_widgets: List[Any] = field(default_factory=list)
-    layer_groups: Dict[str, LayerGroup] = field(default_factory=dict)
-    opened: bool = True
-    text_edit_widgets: List[TextEditWidget] = field(default_factory=list)
+# Document sections built before the window is shown; the rest follow in chunks
+# of at most this many seconds each, so the event loop stays responsive
+INITIAL_DOC_SECTION_COUNT = 8
+DOC_SECTION_CHUNK_BUDGET = 0.008
+# Text and stylesheet of the main window's "Open Story Editor" button, keyed by
+# whether it is enabled (i.e. the editor is closed)
+OPEN_BUTTON_STATES = {
+    True: (
+        "Open Story Editor",
+        "background-color: #414a8e; color: #1a1625; padding: 5px;",
+    ),
+    False: (
+        "Story Editor is Open",
+        "background-color: #666666; color: #999999; padding: 5px;",
+    ),
+}
+
+
+@dataclass(frozen=True, slots=True)
+class ComicMenuInfo:
+    """Parts of comic_config_info used by the thumbnail context menu, derived once."""
+
+    config_filepath: str
+    # Normalized comic folder path with a trailing separator, for prefix tests
+    folder_prefix: str
+    # (display name, path) of the comic's template files
+    template_entries: Tuple[Tuple[str, str], ...]
+
+
+def _normalize_path(path: str) -> str:
+    """Normalize a path for comparisons (separators, '..', case on Windows)."""
+    return os.path.normcase(os.path.normpath(path))
 
 
 class StoryEditorWindow:
@@ -73,6 +78,8 @@ class StoryEditorWindow:
     2. Socket request sent to Krita plugin → "get_all_docs_svg_data"
     3. Krita returns all_docs_svg_data → set_svg_data() receives it
     4. Window created → create_text_editor_window() builds UI
+       (on later responses, e.g. a refresh, only changed texts are patched
+       in place when the documents' structure is unchanged)
     5. User edits text → changes stored in all_docs_text_state
     6. User saves → send_merged_svg_request() sends updates back to Krita
 
@@ -105,7 +112,7 @@ class StoryEditorWindow:
                 'new_text_widgets': List,     # New text elements added
                 'layer_groups': Dict,         # Existing text layers with edits
                 'opened': bool,
-                'text_edit_widgets': List     # QTextEdit widgets for find/replace
+                'text_edit_widgets': List     # TextEditWidget records for find/replace
             }
         }
     """
@@ -122,15 +129,76 @@ class StoryEditorWindow:
         self.socket_handler = socket_handler
         self.all_docs_svg_data = None
         self.parent_window = None  # Will be set by ControlTower
+        # Last OPEN_BUTTON_STATES key applied to the main window's open button
+        self._open_button_state = None
 
         self.doc_layouts = {}  # Store document layouts {doc_name: layout}
+        self.doc_buttons = {}  # Activate buttons {doc_name: QPushButton}
+        self.doc_thumbnails = {}  # Thumbnail labels {doc_name: QLabel}
+        self.doc_status_labels = {}  # Opened/offline labels {doc_name: QLabel}
         self.active_doc_name = None  # Track which document is active for new text
         self.thumbnail_scroll_position = 0  # Track thumbnail scroll position
         self.content_scroll_position = 0  # Track content scroll position
+        self.content_top_doc_name = None  # Document shown at the saved content position
+        self.content_top_doc_offset = 0  # Saved content position relative to that document
 
         self.comic_config_info = None  # To store comic config info
         self.template_files = []  # To store template files list
+        self._comic_menu_info = None  # ComicMenuInfo of comic_config_info
+
+        # Thumbnail context menu and its template submenu, created on first use.
+        # Their actions are connected once; the right-clicked document is kept
+        # in _thumbnail_menu_target as (doc_name, doc_path, config_filepath)
+        self._thumbnail_menu = None
+        self._template_menu = None
+        self._thumbnail_menu_actions = {}  # Action text -> QAction
+        self._thumbnail_menu_target = None
+        self._template_menu_info = None  # ComicMenuInfo the submenu was built for
         self.story_board_window = None  # Store reference to story board window
+        self._content_host = None  # Widget holding the current build's content
+        # Scroll areas of the current build (set by the ui_scroll factories)
+        self.thumbnail_scroll_area_widget = None
+        self.all_docs_scroll_area_widget = None
+        self.all_docs_text_state = {}  # See the class docstring
+
+        # One slot/filter serves every document's activate button and thumbnail
+        # (the document is read from the widget's object name)
+        self.activate_button_group = QButtonGroup()
+        self.activate_button_group.setExclusive(False)
+        self.activate_button_group.buttonClicked.connect(
+            self._on_activate_button_clicked
+        )
+        self.thumbnail_event_filter = ui_thumb.ThumbnailEventFilter(self)
+        # Documents with modified layer editors or new texts, so saving only
+        # has to look at those
+        self.modification_tracker = EditorModificationTracker()
+
+        # Editor font, loaded once per window build and shared by all editors,
+        # with its metrics for estimating initial editor heights
+        self.text_editor_font = None
+        self.text_editor_font_metrics = None
+
+        # Documents whose sections are still to be built [(index, doc_data)],
+        # and the (thumbnail_layout, all_docs_layout) they are built into
+        self._pending_doc_sections = []
+        self._doc_section_layouts = None
+
+        # Documents whose layer editors are created once they scroll into view,
+        # and the populated ones in population order {doc_name: None}
+        self.pending_doc_populations = {}
+        self.doc_population_order = {}
+        self._populating_documents = False
+
+        # SVG parse results, prefetched off the GUI thread and kept across
+        # refreshes while the layer's SVG is unchanged {parsed_svg_cache_key: result}
+        self.parsed_svg_cache = {}
+        self._svg_parse_job = None
+
+        # Thumbnail decodes running on worker threads, keyed by the document the
+        # job was started for {doc_name: (job, cache_key, doc_names showing it)}
+        self._thumbnail_jobs = {}
+        # Decoded thumbnails of the latest build, kept across refreshes {cache_key: QPixmap}
+        self._thumbnail_cache = {}
 
     def set_parent_window(self, parent_window) -> None:
         """Set the persistent parent window"""
@@ -144,29 +212,99 @@ class StoryEditorWindow:
 
     def _save_current_scroll_positions(self) -> None:
         """Save current scroll positions before clearing content."""
-        if hasattr(self, "thumbnail_scroll_area_widget"):
+        if self._content_host is None:
+            # Nothing built (or already released by a refresh); keep the saved values
+            return
+        if self.thumbnail_scroll_area_widget is not None:
             self.thumbnail_scroll_position = (
                 self.thumbnail_scroll_area_widget.verticalScrollBar().value()
             )
-        if hasattr(self, "all_docs_scroll_area_widget"):
+        if self.all_docs_scroll_area_widget is not None:
             self.content_scroll_position = (
                 self.all_docs_scroll_area_widget.verticalScrollBar().value()
             )
+            self.content_top_doc_name = self._find_document_at(
+                self.content_scroll_position
+            )
+            if self.content_top_doc_name is not None:
+                doc_container = self.doc_layouts[
+                    self.content_top_doc_name
+                ].parentWidget()
+                self.content_top_doc_offset = (
+                    self.content_scroll_position - doc_container.geometry().top()
+                )
+
+    def _find_document_at(self, content_y: int) -> Optional[str]:
+        """Find the document section covering a y position of the content area."""
+        for doc_name, doc_layout in self.doc_layouts.items():
+            if doc_layout.parentWidget().geometry().bottom() >= content_y:
+                return doc_name
+        return None
 
     def _clear_previous_content(self) -> None:
         """Clear previous content in parent window's container."""
-        if self.parent_window:
-            while self.parent_window.content_layout.count():
-                child = self.parent_window.content_layout.takeAt(0)
-                if child.widget():
-                    child.widget().deleteLater()
+        if self._content_host is not None:
+            # Deleting the host tears down the whole previous build at once
+            self._content_host.setParent(None)
+            self._content_host.deleteLater()
+            self._content_host = None
+
+    def _release_previous_build(self) -> None:
+        """Drop the previous build and its SVG payload before new data arrives.
+
+        Without this the old payload (full SVG strings and base64 thumbnails
+        of every document) stays referenced by the editor state, background
+        jobs and pending sections while the new copy is being received.
+        """
+        self._save_current_scroll_positions()
+        self._clear_previous_content()
+
+        if self._svg_parse_job is not None:
+            self._svg_parse_job.cancelled = True
+            self._svg_parse_job = None
+        for job, *_ in self._thumbnail_jobs.values():
+            job.cancelled = True
+        self._thumbnail_jobs = {}
+
+        self.all_docs_svg_data = None
+        if self.story_board_window is not None:
+            # An open story board would otherwise keep the old payload alive
+            self.story_board_window.release_svg_data()
+        self._initialize_editor_state()
+
+    def _update_documents_in_place(
+        self, all_docs_svg_data: List[Dict[str, Any]]
+    ) -> bool:
+        """Apply new SVG data to the current build if only texts changed.
+
+        Returns:
+            True if applied, False if the window has to be rebuilt
+        """
+        if self._content_host is None or self._pending_doc_sections:
+            return False
+        if not ui_doc.update_documents_in_place(all_docs_svg_data, self):
+            return False
+
+        self.all_docs_svg_data = all_docs_svg_data
+        # Re-parse pending documents' changed layers and decode changed thumbnails
+        self._start_svg_parse_job()
+        self._start_thumbnail_decode_jobs()
+        return True
 
     def _initialize_editor_state(self) -> None:
         """Initialize/reset editor state variables."""
         self.all_docs_text_state = {}
+        self.modification_tracker.modified_docs.clear()
         self.new_text_widgets = []
         self.doc_layouts = {}
+        self.doc_buttons = {}
+        self.doc_thumbnails = {}
+        self.doc_status_labels = {}
         self.active_doc_name = None
+        self._pending_doc_sections = []
+        self._doc_section_layouts = None
+        self.pending_doc_populations = {}
+        self.doc_population_order = {}
 
     def _create_thumbnail_scroll_area(self):
         """Create scroll area for document thumbnails - delegates to ui_components."""
@@ -184,6 +322,207 @@ class StoryEditorWindow:
             index, doc_data, thumbnail_layout, all_docs_layout, self
         )
 
+    def _start_svg_parse_job(self) -> None:
+        """Parse every layer's SVG on a worker thread ahead of population.
+
+        Parsing starts at the document the restored scroll position will show,
+        so the sections populated right after the restore are parsed first.
+        Cached results of layers whose SVG is unchanged are kept (and not parsed
+        again); results of layers no longer present are dropped.
+        """
+        if self._svg_parse_job is not None:
+            self._svg_parse_job.cancelled = True
+
+        docs = self.all_docs_svg_data
+        start = 0
+        if self.content_scroll_position > 0 and self.content_top_doc_name:
+            start = next(
+                (
+                    index
+                    for index, doc_data in enumerate(docs)
+                    if doc_data.get("document_name") == self.content_top_doc_name
+                ),
+                0,
+            )
+
+        layers = [
+            (
+                doc_data.get("document_name", "unknown"),
+                doc_data.get("document_path", "unknown"),
+                layer_data.get("layer_id", "unknown"),
+                layer_data.get("svg", ""),
+            )
+            for doc_data in docs[start:] + docs[:start]
+            for layer_data in doc_data.get("svg_data", [])
+        ]
+
+        # A new dict, so a job still running on old data cannot write into it
+        previous_cache = self.parsed_svg_cache
+        self.parsed_svg_cache = {}
+        for doc_name, _doc_path, layer_id, svg_content in layers:
+            key = parsed_svg_cache_key(doc_name, layer_id, svg_content)
+            if key in previous_cache:
+                self.parsed_svg_cache[key] = previous_cache[key]
+
+        job = SvgParseJob(layers, self.parsed_svg_cache)
+        job.signals.finished.connect(self._on_svg_parse_finished)
+        self._svg_parse_job = job
+        QThreadPool.globalInstance().start(job)
+
+    def _on_svg_parse_finished(self, results: Dict[Any, Any]) -> None:
+        """Release the finished parse job (ignores jobs from a previous build)."""
+        if self._svg_parse_job is not None and self._svg_parse_job.results is results:
+            self._svg_parse_job = None
+
+    def _start_thumbnail_decode_jobs(self) -> None:
+        """Decode every document thumbnail on worker threads.
+
+        Thumbnails whose data is unchanged since the previous build are taken
+        from the cache instead (and left alone if their label already shows
+        them). The cache only keeps this build's thumbnails, so it is bounded
+        by the document count. Documents sharing the same thumbnail data (e.g.
+        pages made from one template) share a single decode.
+        """
+        for job, *_ in self._thumbnail_jobs.values():
+            job.cancelled = True
+        self._thumbnail_jobs = {}
+
+        previous_cache = self._thumbnail_cache
+        self._thumbnail_cache = {}
+        # Documents waiting for a decode started in this pass {cache_key: doc_names}
+        started_decodes = {}
+
+        for doc_data in self.all_docs_svg_data:
+            thumbnail = doc_data.get("thumbnail", None)
+            if not thumbnail:
+                continue
+
+            doc_name = doc_data.get("document_name", "unknown")
+            cache_key = hashlib.blake2b(
+                thumbnail.encode("utf-8"), digest_size=16
+            ).digest()
+
+            pixmap = previous_cache.get(cache_key)
+            if pixmap is not None:
+                self._thumbnail_cache[cache_key] = pixmap
+                thumbnail_label = self.doc_thumbnails[doc_name]
+                if thumbnail_label.property("thumbnail_key") != cache_key:
+                    ui_thumb.set_thumbnail_image(thumbnail_label, pixmap)
+                    thumbnail_label.setProperty("thumbnail_key", cache_key)
+                continue
+
+            doc_names = started_decodes.get(cache_key)
+            if doc_names is not None:
+                doc_names.append(doc_name)
+                continue
+
+            doc_names = started_decodes[cache_key] = [doc_name]
+            job = ThumbnailDecodeJob(doc_name, thumbnail, ui_thumb.THUMBNAIL_LABEL_WIDTH)
+            job.signals.decoded.connect(self._on_thumbnail_decoded)
+            self._thumbnail_jobs[doc_name] = (job, cache_key, doc_names)
+            QThreadPool.globalInstance().start(job)
+
+    def _on_thumbnail_decoded(self, job: ThumbnailDecodeJob) -> None:
+        """Show and cache a decoded thumbnail (ignores jobs from a previous build)."""
+        current_job, cache_key, doc_names = self._thumbnail_jobs.get(
+            job.doc_name, (None, None, None)
+        )
+        if current_job is not job:
+            return
+        del self._thumbnail_jobs[job.doc_name]
+
+        # Converted once here; cache hits reuse the QPixmap as is
+        pixmap = QPixmap.fromImage(job.image, Qt.NoFormatConversion)
+        if not pixmap.isNull():
+            self._thumbnail_cache[cache_key] = pixmap
+
+        for doc_name in doc_names:
+            thumbnail_label = self.doc_thumbnails.get(doc_name)
+            if thumbnail_label is not None:
+                ui_thumb.set_thumbnail_image(thumbnail_label, pixmap)
+                if not pixmap.isNull():
+                    thumbnail_label.setProperty("thumbnail_key", cache_key)
+
+    def _populate_visible_documents(self, *_args) -> None:
+        """Create layer editors near the viewport and release distant unedited ones."""
+        if self._populating_documents:
+            return
+        self._populating_documents = True
+        try:
+            ui_doc.populate_visible_documents(self.all_docs_scroll_area_widget, self)
+            ui_doc.release_distant_documents(self.all_docs_scroll_area_widget, self)
+        finally:
+            self._populating_documents = False
+
+    def _build_doc_sections(self, count: int) -> None:
+        """Build the next ``count`` pending document sections.
+
+        The last call finishes the layouts, starts the thumbnail decodes and
+        restores the saved scroll positions.
+        """
+        if not self._pending_doc_sections:
+            return
+
+        thumbnail_layout, all_docs_layout = self._doc_section_layouts
+        chunk = self._pending_doc_sections[:count]
+        del self._pending_doc_sections[:count]
+        for index, doc_data in chunk:
+            self._create_document_section(
+                index, doc_data, thumbnail_layout, all_docs_layout
+            )
+
+        if self._pending_doc_sections:
+            return
+
+        # Add stretch at the end of thumbnail layout (inside the container for proper scrolling)
+        thumbnail_layout.setRowStretch(thumbnail_layout.rowCount(), 1)
+
+        # Add stretch at the end of all_docs_layout (inside the container for proper scrolling)
+        all_docs_layout.addStretch()
+
+        # Thumbnails are decoded off the GUI thread and filled in as they finish
+        self._start_thumbnail_decode_jobs()
+
+        # Restore scroll positions once every section exists
+        self._restore_scroll_positions()
+
+    def _build_next_doc_section_chunk(self) -> None:
+        """Build document sections for one time slice, then yield to the event loop."""
+        if not self._pending_doc_sections:
+            return
+        deadline = time.perf_counter() + DOC_SECTION_CHUNK_BUDGET
+        self._set_doc_section_updates_enabled(False)
+        try:
+            while self._pending_doc_sections:
+                self._build_doc_sections(1)
+                if time.perf_counter() >= deadline:
+                    break
+        finally:
+            self._set_doc_section_updates_enabled(True)
+        self._populate_visible_documents()
+        if self._pending_doc_sections:
+            QTimer.singleShot(0, self._build_next_doc_section_chunk)
+
+    def _set_doc_section_updates_enabled(self, enabled: bool) -> None:
+        """Suspend or resume painting of both section containers.
+
+        Sections added while suspended are laid out and painted once on
+        resume instead of after every section.
+        """
+        for layout in self._doc_section_layouts or ():
+            layout.parentWidget().setUpdatesEnabled(enabled)
+
+    def _populate_all_documents(self) -> None:
+        """Create layer editors for every document still pending population."""
+        if self._pending_doc_sections:
+            self._set_doc_section_updates_enabled(False)
+            try:
+                self._build_doc_sections(len(self._pending_doc_sections))
+            finally:
+                self._set_doc_section_updates_enabled(True)
+        for doc_name in list(self.pending_doc_populations):
+            ui_doc.populate_document(doc_name, self)
+
     def create_text_editor_window(self) -> None:
         """Create the content for the Story Editor"""
         if not self.all_docs_svg_data:
@@ -192,88 +531,186 @@ class StoryEditorWindow:
             )
             return
 
-        # Prepare for new window creation
+        # Prepare for new window creation. The previous host stays in place
+        # until the new one replaces it, but must no longer drive population.
         self._save_current_scroll_positions()
-        self._clear_previous_content()
+        previous_host = self._content_host
+        if previous_host is not None:
+            previous_scroll_bar = self.all_docs_scroll_area_widget.verticalScrollBar()
+            previous_scroll_bar.valueChanged.disconnect(self._populate_visible_documents)
+            previous_scroll_bar.rangeChanged.disconnect(self._populate_visible_documents)
         self._initialize_editor_state()
 
-        # Create main layout
-        thumbnail_and_text_layout = QHBoxLayout()
+        # Load editor font once instead of per text element
+        self.text_editor_font = get_text_editor_font()
+        self.text_editor_font_metrics = QFontMetrics(self.text_editor_font)
+
+        # Parse SVG layers in the background while the UI is being built
+        self._start_svg_parse_job()
+
+        # Create main layout on a fresh host widget (replaced on every rebuild)
+        self._content_host = QWidget()
+        thumbnail_and_text_layout = QHBoxLayout(self._content_host)
 
         # Create thumbnail and content scroll areas
         thumbnail_scroll_area, thumbnail_layout = self._create_thumbnail_scroll_area()
         all_docs_scroll_area, all_docs_layout = self._create_content_scroll_area()
 
+        # One stylesheet per shared container styles every thumbnail and
+        # document section
+        thumbnail_layout.parentWidget().setStyleSheet(
+            ui_thumb.create_thumbnails_stylesheet()
+        )
+        all_docs_layout.parentWidget().setStyleSheet(
+            ui_doc.create_documents_stylesheet()
+        )
+
         thumbnail_and_text_layout.addWidget(thumbnail_scroll_area)
         thumbnail_and_text_layout.addWidget(all_docs_scroll_area)
         thumbnail_and_text_layout.setContentsMargins(*MAIN_LAYOUT_MARGINS)
 
-        # Process all documents
-        for index, doc_data in enumerate(self.all_docs_svg_data):
-            self._create_document_section(
-                index, doc_data, thumbnail_layout, all_docs_layout
-            )
+        # Build the first document sections now; the rest are built in chunks
+        # from the event loop once the window is up
+        self._pending_doc_sections = list(enumerate(self.all_docs_svg_data))
+        self._doc_section_layouts = (thumbnail_layout, all_docs_layout)
+        self._build_doc_sections(INITIAL_DOC_SECTION_COUNT)
 
-        # Add stretch at the end of thumbnail layout (inside the container for proper scrolling)
-        thumbnail_layout.setRowStretch(thumbnail_layout.rowCount(), 1)
-
-        # Add stretch at the end of all_docs_layout (inside the container for proper scrolling)
-        all_docs_layout.addStretch()
+        # Populate document sections as they scroll (or resize) into view.
+        # Connected only now so building the first sections never triggers it.
+        content_scroll_bar = all_docs_scroll_area.verticalScrollBar()
+        content_scroll_bar.valueChanged.connect(self._populate_visible_documents)
+        content_scroll_bar.rangeChanged.connect(self._populate_visible_documents)
 
         # Add content to parent window's container
         if self.parent_window:
-            self.parent_window.content_layout.addLayout(thumbnail_and_text_layout)
+            # Swap in the new content and its first editors without painting
+            # the intermediate states in between
+            self.parent_window.setUpdatesEnabled(False)
+            try:
+                if previous_host is not None:
+                    # One swap in the layout slot; deleting the previous host
+                    # tears down the whole previous build at once
+                    self.parent_window.content_layout.replaceWidget(
+                        previous_host, self._content_host
+                    )
+                    previous_host.setParent(None)
+                    previous_host.deleteLater()
+                    previous_host = None
+                else:
+                    self.parent_window.content_layout.addWidget(self._content_host)
+
+                # Show the parent window
+                self.parent_window.show()
+                self._populate_visible_documents()
+            finally:
+                self.parent_window.setUpdatesEnabled(True)
 
-            # Show the parent window
-            self.parent_window.show()
+        if previous_host is not None:
+            previous_host.setParent(None)
+            previous_host.deleteLater()
 
-            # Restore scroll positions after window is shown (use QTimer to ensure scrollbars are ready)
-            QTimer.singleShot(100, self._restore_scroll_positions)
+        if self._pending_doc_sections:
+            QTimer.singleShot(0, self._build_next_doc_section_chunk)
 
     def add_new_text_widget(self) -> None:
         """Add a new empty text editor widget for creating new text"""
-        add_new_text_widget(
+        if add_new_text_widget(
             self.active_doc_name,
             self.doc_layouts,
             self.all_docs_text_state,
             self.socket_handler,
-        )
+            font=self.text_editor_font,
+        ):
+            self.modification_tracker.modified_docs.add(self.active_doc_name)
 
     def _restore_scroll_positions(self) -> None:
-        """Restore saved scroll positions for both scroll areas"""
+        """Restore saved scroll positions for both scroll areas.
+
+        The content area is restored to the document that was at its top, so
+        the view stays on that document if sections above it changed.
+        """
         if (
-            hasattr(self, "thumbnail_scroll_area_widget")
+            self.thumbnail_scroll_area_widget is not None
             and self.thumbnail_scroll_position > 0
         ):
-            self.thumbnail_scroll_area_widget.verticalScrollBar().setValue(
-                self.thumbnail_scroll_position
+            self._restore_scroll_position_after_layout(
+                self.thumbnail_scroll_area_widget.verticalScrollBar(),
+                lambda: self.thumbnail_scroll_position,
             )
-
         if (
-            hasattr(self, "all_docs_scroll_area_widget")
+            self.all_docs_scroll_area_widget is not None
             and self.content_scroll_position > 0
         ):
-            self.all_docs_scroll_area_widget.verticalScrollBar().setValue(
-                self.content_scroll_position
+            self._restore_scroll_position_after_layout(
+                self.all_docs_scroll_area_widget.verticalScrollBar(),
+                self._content_anchor_position,
             )
 
+    def _content_anchor_position(self) -> int:
+        """Content position of the saved top document plus the saved offset.
+
+        Falls back to the saved pixel position if that document is gone.
+        """
+        doc_layout = self.doc_layouts.get(self.content_top_doc_name)
+        if doc_layout is None:
+            return self.content_scroll_position
+        doc_top = doc_layout.parentWidget().geometry().top()
+        return max(doc_top + self.content_top_doc_offset, 0)
+
+    def _restore_scroll_position_after_layout(
+        self, scroll_bar: QScrollBar, target_position: Callable[[], int]
+    ) -> None:
+        """Set a scroll bar's value once the new sections have been laid out.
+
+        The value is set after the pending show and layout events, when the
+        range is final, and clamped to that range. Intermediate values are not
+        applied, as they would populate the documents scrolled past. Nothing is
+        restored if the user scrolls first.
+        """
+
+        def restore() -> None:
+            scroll_bar.actionTriggered.disconnect(cancel)
+            scroll_bar.setValue(min(target_position(), scroll_bar.maximum()))
+
+        def cancel(_action: int) -> None:
+            restore_timer.stop()
+            scroll_bar.actionTriggered.disconnect(cancel)
+
+        restore_timer = QTimer(scroll_bar)
+        restore_timer.setSingleShot(True)
+        restore_timer.timeout.connect(restore)
+        scroll_bar.actionTriggered.connect(cancel)
+        restore_timer.start(0)
+
     def send_merged_svg_request(self) -> None:
         """Send update requests for all modified texts and add new texts"""
 
+        modified_docs = self.modification_tracker.modified_docs
+        if not modified_docs:
+            self.socket_handler.log("⚠️ No updates or new texts to send.")
+            return
+
         merged_requests = []
 
         self.socket_handler.log(f"⏳ Processing update data for documents...")
 
         for doc_name, doc_state in self.all_docs_text_state.items():
+            if doc_name not in modified_docs:
+                continue
 
             # write_log(f"Processing document: {doc_name}")
 
             doc_path = doc_state["document_path"]
-            # layer_groups Contains all changes for the existing layers
-            layer_groups = doc_state["layer_groups"]
+            # layer_groups Contains the changes of the layers the user edited
+            layer_groups = self._dirty_layer_groups(doc_state)
             # new_text_widgets Contains all new text widgets added by the user
             new_text_widgets = doc_state["new_text_widgets"]
 
+            if not layer_groups and not new_text_widgets:
+                # Its edits were reverted (or its editors refreshed)
+                modified_docs.discard(doc_name)
+                continue
+
             result = create_svg_data_for_doc(
                 doc_name=doc_name,
                 doc_path=doc_path,
@@ -312,31 +749,51 @@ class StoryEditorWindow:
             self.socket_handler.log(
                 f"--- {len(merged_requests)} documents to update ---"
             )
-            self.socket_handler.send_request(
+            # Several documents can make a large payload, so it is encoded
+            # off the GUI thread; a single document is sent right away
+            send_request = (
+                self.socket_handler.send_request_in_background
+                if len(merged_requests) > 1
+                else self.socket_handler.send_request
+            )
+            send_request(
                 "docs_svg_update",
                 merged_requests=merged_requests,
-                krita_files_folder=(
-                    self.parent.krita_files_folder
-                    if hasattr(self.parent, "krita_files_folder")
-                    else None
-                ),
+                krita_files_folder=getattr(self.parent, "krita_files_folder", None),
             )
         else:
             self.socket_handler.log("⚠️ No updates or new texts to send.")
 
+    def _dirty_layer_groups(self, doc_state: Dict[str, Any]) -> Dict[str, Any]:
+        """Get the layer groups of a document with at least one modified editor.
+
+        Editors are filled with setPlainText(), which leaves their document
+        unmodified, so the modified flag marks the layers the user edited
+        without reading back every editor's text.
+        """
+        return {
+            layer_id: layer_group
+            for layer_id, layer_group in doc_state["layer_groups"].items()
+            if any(
+                change.new_text.document().isModified()
+                for change in layer_group["changes"]
+            )
+        }
+
     def show_text_editor(self) -> None:
         """Show text editor window with SVG data from Krita document"""
-        # Clear any existing data
-        self.all_docs_svg_data = None
+        # Clear any existing data (and the build made from it) before requesting
+        self._release_previous_build()
+        self._request_svg_data()
 
+    def _request_svg_data(self) -> None:
+        """Request all documents' SVG data; the response goes to set_svg_data()"""
         # Set the waiting flag on the parent (main window)
         if hasattr(self.parent, "_waiting_for_svg"):
             self.parent._waiting_for_svg = "text_editor"
 
         # Get krita folder path if available
-        krita_folder_path = None
-        if hasattr(self.parent, "krita_files_folder"):
-            krita_folder_path = self.parent.krita_files_folder
+        krita_folder_path = getattr(self.parent, "krita_files_folder", None)
 
         # Request the SVG data
         # The window will be created when set_svg_data() is called with the response
@@ -349,15 +806,70 @@ class StoryEditorWindow:
 
     def set_svg_data(self, all_docs_svg_data: List[Dict[str, Any]]) -> None:
         """Store the received SVG data and create the editor window"""
-        self.all_docs_svg_data = all_docs_svg_data
-        # Automatically create the window when data is received
-        self.create_text_editor_window()
+        self._intern_identifiers(all_docs_svg_data)
+        self._share_unchanged_svg_strings(all_docs_svg_data)
+        if self._update_documents_in_place(all_docs_svg_data):
+            self.socket_handler.log("🔄 Updated the changed texts without rebuilding")
+        else:
+            self.all_docs_svg_data = all_docs_svg_data
+            # Automatically create the window when data is received
+            self.create_text_editor_window()
         # Disable the open button when window is shown
         self._update_open_button_state(False)
 
+    def _intern_identifiers(self, all_docs_svg_data: List[Dict[str, Any]]) -> None:
+        """Intern the document names and layer IDs of newly received data.
+
+        They key every per-document and per-layer dict, so interned keys make
+        most lookups and comparisons identity checks instead of string
+        compares, and repeated names share one string.
+        """
+        for doc_data in all_docs_svg_data:
+            doc_name = doc_data.get("document_name")
+            if isinstance(doc_name, str):
+                doc_data["document_name"] = sys.intern(doc_name)
+            for layer_data in doc_data.get("svg_data", []):
+                layer_id = layer_data.get("layer_id")
+                if isinstance(layer_id, str):
+                    layer_data["layer_id"] = sys.intern(layer_id)
+
+    def _share_unchanged_svg_strings(
+        self, all_docs_svg_data: List[Dict[str, Any]]
+    ) -> None:
+        """Make equal layer SVG strings one shared object.
+
+        Layers unchanged since the current data reuse its string (the freshly
+        decoded copy is freed right away, and later comparisons and hashes of
+        it are instant); equal layers within the new data share one string.
+        Unchanged base64 thumbnails are shared the same way.
+        """
+        canonical = {}
+        for docs_svg_data in (self.all_docs_svg_data or [], all_docs_svg_data):
+            for doc_data in docs_svg_data:
+                thumbnail = doc_data.get("thumbnail")
+                if thumbnail:
+                    doc_data["thumbnail"] = canonical.setdefault(thumbnail, thumbnail)
+                for layer_data in doc_data.get("svg_data", []):
+                    svg_content = layer_data.get("svg")
+                    if svg_content:
+                        layer_data["svg"] = canonical.setdefault(
+                            svg_content, svg_content
+                        )
+
     def set_comic_config_info(self, comic_config_info: Dict[str, Any]) -> None:
         """Store the comic config info for future use"""
         self.comic_config_info = comic_config_info
+        config_filepath = comic_config_info.get("config_filepath", "")
+        self._comic_menu_info = ComicMenuInfo(
+            config_filepath=config_filepath,
+            folder_prefix=os.path.join(
+                _normalize_path(os.path.dirname(config_filepath)), ""
+            ),
+            template_entries=tuple(
+                (os.path.basename(template), template)
+                for template in comic_config_info.get("template_files", [])
+            ),
+        )
 
     def _on_window_close(self, event: Any) -> None:
         """Handle window close event to re-enable the open button"""
@@ -369,17 +881,21 @@ class StoryEditorWindow:
     def _update_open_button_state(self, enabled: bool) -> None:
         """Update the state of the 'Open Story Editor' button in the main window"""
         if hasattr(self.parent, "show_story_editor_btn"):
+            # The main window also toggles it on (dis)connection
             self.parent.show_story_editor_btn.setEnabled(enabled)
-            if enabled:
-                self.parent.show_story_editor_btn.setText("Open Story Editor")
-                self.parent.show_story_editor_btn.setStyleSheet(
-                    "background-color: #414a8e; color: #1a1625; padding: 5px;"
-                )
-            else:
-                self.parent.show_story_editor_btn.setText("Story Editor is Open")
-                self.parent.show_story_editor_btn.setStyleSheet(
-                    "background-color: #666666; color: #999999; padding: 5px;"
-                )
+            # Text and stylesheet are only replaced when the state flips, so
+            # the sheet is not parsed again on every open/close
+            if self._open_button_state == enabled:
+                return
+            text, stylesheet = OPEN_BUTTON_STATES[enabled]
+            self.parent.show_story_editor_btn.setText(text)
+            self.parent.show_story_editor_btn.setStyleSheet(stylesheet)
+            self._open_button_state = enabled
+
+    def _on_activate_button_clicked(self, button: QPushButton) -> None:
+        """Handle a click on any document's activate button"""
+        doc_name = button.objectName()[len(ui_doc.ACTIVATE_BUTTON_OBJECT_NAME_PREFIX) :]
+        self.activate_document(doc_name, button)
 
     def thumbnail_clicked(self, doc_name: str) -> None:
         """Handle thumbnail click - activate the document"""
@@ -389,27 +905,27 @@ class StoryEditorWindow:
         self, doc_name: str, clicked_btn: Optional[QPushButton] = None
     ) -> None:
         """Activate a document for adding new text"""
-        # Uncheck all other buttons and reset thumbnail borders
-        if hasattr(self, "doc_buttons"):
-            for name, btn in self.doc_buttons.items():
-                if name != doc_name:
-                    btn.setChecked(False)
-                    # Reset thumbnail border
-                    if hasattr(self, "doc_thumbnails") and name in self.doc_thumbnails:
-                        thumbnail = self.doc_thumbnails[name]
-                        default_border = thumbnail.property("default_border")
-                        thumbnail.setStyleSheet(f"border: 2px solid {default_border};")
-
-        # Check the clicked button and update its thumbnail
-        if hasattr(self, "doc_buttons") and doc_name in self.doc_buttons:
+        # New text is appended after the existing editors, so make sure they exist
+        ui_doc.populate_document(doc_name, self)
+
+        # Only the previously active document can be checked/highlighted, so
+        # uncheck its button and un-highlight its thumbnail
+        previous_doc_name = self.active_doc_name
+        if previous_doc_name is not None and previous_doc_name != doc_name:
+            if previous_doc_name in self.doc_buttons:
+                self.doc_buttons[previous_doc_name].setChecked(False)
+            if previous_doc_name in self.doc_thumbnails:
+                ui_thumb.set_thumbnail_active(
+                    self.doc_thumbnails[previous_doc_name], False
+                )
+
+        # Check the clicked button (clicking the active document's button
+        # toggles it off) and highlight the thumbnail if it is not already
+        if doc_name in self.doc_buttons:
             self.doc_buttons[doc_name].setChecked(True)
 
-        if hasattr(self, "doc_thumbnails") and doc_name in self.doc_thumbnails:
-            thumbnail = self.doc_thumbnails[doc_name]
-            active_border = thumbnail.property("active_border")
-            thumbnail.setStyleSheet(
-                f"border: 3px solid {active_border}; border-color: blue;"
-            )
+        if doc_name != previous_doc_name and doc_name in self.doc_thumbnails:
+            ui_thumb.set_thumbnail_active(self.doc_thumbnails[doc_name], True)
 
         # Set active document
         self.active_doc_name = doc_name
@@ -418,8 +934,9 @@ class StoryEditorWindow:
     def refresh_data(self) -> None:
         """Refresh the editor window with latest data from Krita"""
         self.socket_handler.log("🔄 Refreshing data from Krita")
-        # Simply request new data, which will rebuild the window
-        self.show_text_editor()
+        # Keep the current build: set_svg_data() patches it in place when only
+        # texts changed, and rebuilds the window otherwise
+        self._request_svg_data()
 
     def save_all_opened_docs(self) -> None:
         """Save all opened Krita documents"""
@@ -428,11 +945,20 @@ class StoryEditorWindow:
 
     def show_find_replace(self) -> None:
         """Show the find/replace dialog"""
-        if not hasattr(self, "all_docs_text_state") or not self.all_docs_text_state:
+        if not self.all_docs_text_state:
             self.socket_handler.log("⚠️ No text editors available")
             return
 
-        show_find_replace_dialog(self.parent_window, self.all_docs_text_state)
+        # Find/replace has to see every editor, not only the ones scrolled into view
+        self._populate_all_documents()
+
+        # The dialog holds on to the editors, so nothing may be released while
+        # it runs its event loop
+        self._populating_documents = True
+        try:
+            show_find_replace_dialog(self.parent_window, self.all_docs_text_state)
+        finally:
+            self._populating_documents = False
 
     def show_story_board(self) -> None:
         """Show the story board window with all thumbnails"""
@@ -440,8 +966,18 @@ class StoryEditorWindow:
             self.socket_handler.log("⚠️ No document data available")
             return
 
-        # Close existing story board window if open
         if self.story_board_window is not None:
+            # Reuse the window while it shows the current data, instead of
+            # decoding and laying out every thumbnail again
+            if (
+                self.story_board_window.all_docs_svg_data is self.all_docs_svg_data
+                and not self.story_board_window.thumbnails_cancelled
+            ):
+                self.story_board_window.show()
+                self.story_board_window.raise_()
+                self.story_board_window.activateWindow()
+                return
+            # Close the window showing older data
             self.story_board_window.close()
 
         # Create new story board window as independent popup (no parent to make it separate)
@@ -450,22 +986,22 @@ class StoryEditorWindow:
 
     def scroll_to_bottom(self) -> None:
         """Scroll the content area to the bottom"""
-        if hasattr(self, "thumbnail_scroll_area_widget"):
+        if self.thumbnail_scroll_area_widget is not None:
             self.thumbnail_scroll_area_widget.verticalScrollBar().setValue(
                 self.thumbnail_scroll_area_widget.verticalScrollBar().maximum()
             )
-        if hasattr(self, "all_docs_scroll_area_widget"):
+        if self.all_docs_scroll_area_widget is not None:
             self.all_docs_scroll_area_widget.verticalScrollBar().setValue(
                 self.all_docs_scroll_area_widget.verticalScrollBar().maximum()
             )
 
     def scroll_to_top(self) -> None:
         """Scroll the content area to the top"""
-        if hasattr(self, "thumbnail_scroll_area_widget"):
+        if self.thumbnail_scroll_area_widget is not None:
             self.thumbnail_scroll_area_widget.verticalScrollBar().setValue(
                 self.thumbnail_scroll_area_widget.verticalScrollBar().minimum()
             )
-        if hasattr(self, "all_docs_scroll_area_widget"):
+        if self.all_docs_scroll_area_widget is not None:
             self.all_docs_scroll_area_widget.verticalScrollBar().setValue(
                 self.all_docs_scroll_area_widget.verticalScrollBar().minimum()
             )
@@ -474,6 +1010,37 @@ class StoryEditorWindow:
     # Context Menu Handlers
     # ===================================================================
 
+    def _create_thumbnail_menu(self) -> None:
+        """Create the thumbnail context menu and connect its actions once."""
+        menu = QMenu(self.parent_window)
+        menu.setStyleSheet(get_thumbnail_right_click_menu_stylesheet())
+        self._template_menu = QMenu(menu)
+        self._template_menu.setStyleSheet(get_thumbnail_right_click_menu_stylesheet())
+        # One slot serves every template action; the template is the action's data
+        self._template_menu.triggered.connect(self._on_template_action_triggered)
+
+        actions = self._thumbnail_menu_actions
+        for text, slot in (
+            ("Activate", self._on_activate_action_triggered),
+            ("Open", self._on_open_action_triggered),
+            ("Close", self._on_close_action_triggered),
+        ):
+            actions[text] = menu.addAction(text)
+            actions[text].triggered.connect(slot)
+
+        # Actions below the separator only apply to documents of the comic folder
+        actions["separator"] = menu.addSeparator()
+        actions["Add From Template"] = menu.addAction("Add From Template")
+        actions["Add From Template"].setMenu(self._template_menu)
+        for text, slot in (
+            ("Duplicate", self._on_duplicate_action_triggered),
+            ("Delete", self._on_delete_action_triggered),
+        ):
+            actions[text] = menu.addAction(text)
+            actions[text].triggered.connect(slot)
+
+        self._thumbnail_menu = menu
+
     def show_thumbnail_context_menu(
         self,
         pos: Any,
@@ -483,78 +1050,64 @@ class StoryEditorWindow:
         comic_config_info: Optional[Dict[str, Any]],
     ) -> None:
         """Show context menu for thumbnail"""
-        menu = QMenu(self.parent_window)
-        menu.setStyleSheet(get_thumbnail_right_click_menu_stylesheet())
+        if self._thumbnail_menu is None:
+            self._create_thumbnail_menu()
 
-        # Add "Activate" action
-        activate_action = menu.addAction("Activate")
-        activate_action.triggered.connect(
-            lambda: self.send_activate_document_request(doc_name)
+        # Only documents belonging to the comic folder can be modified
+        menu_info = self._comic_menu_info
+        in_comic_folder = (
+            bool(comic_config_info)
+            and menu_info is not None
+            # Plain prefix test on normalized paths (the same match as comparing
+            # against Path(doc_path).parents, without building the Path objects)
+            and _normalize_path(doc_path).startswith(menu_info.folder_prefix)
         )
-
-        # Add "Open" action
-        open_action = menu.addAction(f"Open")
-        open_action.triggered.connect(lambda: self.send_open_document_request(doc_path))
-
-        # Add "Close" action
-        close_action = menu.addAction("Close")
-        close_action.triggered.connect(
-            lambda: self.send_close_document_request(doc_name)
+        config_filepath = menu_info.config_filepath if in_comic_folder else None
+        self._thumbnail_menu_target = (doc_name, doc_path, config_filepath)
+
+        # The template actions only change with the comic config
+        if in_comic_folder and self._template_menu_info is not menu_info:
+            self._template_menu.clear()
+            for template_name, template in menu_info.template_entries:
+                self._template_menu.addAction(template_name).setData(template)
+            self._template_menu_info = menu_info
+
+        actions = self._thumbnail_menu_actions
+        for text in ("separator", "Duplicate", "Delete"):
+            actions[text].setVisible(in_comic_folder)
+        actions["Add From Template"].setVisible(
+            in_comic_folder and bool(menu_info.template_entries)
         )
 
-        # Only documents belonging to the comic folder can be modified
-        if comic_config_info:
-            config_filepath = comic_config_info.get("config_filepath", "")
-            doc_path_obj = Path(doc_path)
-            config_parent = Path(config_filepath).parent
-            if (
-                config_parent in doc_path_obj.parents
-                or doc_path_obj.parent == config_parent
-            ):
-                # print(f"Document {doc_name} is in config folder or its subfolder")
-
-                # Add separator
-                menu.addSeparator()
-
-                # Add "Add From Template" action with submenu
-                template_files = comic_config_info.get("template_files", [])
-                if template_files:
-                    add_new_action = menu.addAction("Add From Template")
-                    select_template_menu = QMenu(self.parent_window)
-                    select_template_menu.setStyleSheet(
-                        get_thumbnail_right_click_menu_stylesheet()
-                    )
+        # Show menu at global position
+        menu = self._thumbnail_menu
+        menu.exec_(thumbnail_label.mapToGlobal(pos))
 
-                    for template in template_files:
-                        template_name = os.path.basename(template)
-                        template_action = QAction(template_name, self.parent_window)
-                        template_action.triggered.connect(
-                            lambda checked, t=template: self.send_add_new_document_from_template_request(
-                                doc_path, t, config_filepath
-                            )
-                        )
-                        select_template_menu.addAction(template_action)
+    def _on_activate_action_triggered(self) -> None:
+        doc_name, _, _ = self._thumbnail_menu_target
+        self.send_activate_document_request(doc_name)
 
-                    add_new_action.setMenu(select_template_menu)
+    def _on_open_action_triggered(self) -> None:
+        _, doc_path, _ = self._thumbnail_menu_target
+        self.send_open_document_request(doc_path)
 
-                # Add "Duplicate" action
-                duplicate_action = menu.addAction("Duplicate")
-                duplicate_action.triggered.connect(
-                    lambda: self.send_duplicate_document_request(
-                        doc_name, doc_path, config_filepath
-                    )
-                )
+    def _on_close_action_triggered(self) -> None:
+        doc_name, _, _ = self._thumbnail_menu_target
+        self.send_close_document_request(doc_name)
 
-                # Add "Delete" action
-                delete_action = menu.addAction("Delete")
-                delete_action.triggered.connect(
-                    lambda: self.send_delete_document_request(
-                        doc_name, doc_path, config_filepath
-                    )
-                )
+    def _on_template_action_triggered(self, action: Any) -> None:
+        _, doc_path, config_filepath = self._thumbnail_menu_target
+        self.send_add_new_document_from_template_request(
+            doc_path, action.data(), config_filepath
+        )
 
-        # Show menu at global position
-        menu.exec_(thumbnail_label.mapToGlobal(pos))
+    def _on_duplicate_action_triggered(self) -> None:
+        doc_name, doc_path, config_filepath = self._thumbnail_menu_target
+        self.send_duplicate_document_request(doc_name, doc_path, config_filepath)
+
+    def _on_delete_action_triggered(self) -> None:
+        doc_name, doc_path, config_filepath = self._thumbnail_menu_target
+        self.send_delete_document_request(doc_name, doc_path, config_filepath)
 
     def send_open_document_request(self, doc_path: str) -> None:
         """Send open_document request to the agent"""
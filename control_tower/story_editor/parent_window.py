@@ -3,6 +3,7 @@ from PyQt5.QtWidgets import (
     QVBoxLayout,
     QToolBar,
     QAction,
+    QSizePolicy,
 )
 from PyQt5.QtCore import QSize, Qt
 from PyQt5.QtGui import QIcon
@@ -20,6 +21,20 @@ from config.shortcuts_loader import (
     PIN_WINDOW_SHORTCUT,
 )
 
+ICON_DIR = os.path.join(os.path.dirname(__file__), "icons")
+
+# Toolbar icons by file name, loaded on first use and reused afterwards (the
+# pin icon is swapped on every toggle)
+_icons = {}
+
+
+def _icon(file_name):
+    """Get the shared QIcon for a file in ICON_DIR."""
+    icon = _icons.get(file_name)
+    if icon is None:
+        icon = _icons[file_name] = QIcon(os.path.join(ICON_DIR, file_name))
+    return icon
+
 
 class StoryEditorParentWindow(QWidget):
     """Persistent parent window that contains the toolbar and content area"""
@@ -41,11 +56,8 @@ class StoryEditorParentWindow(QWidget):
         toolbar.setStyleSheet(get_toolbar_stylesheet())
         main_layout.addWidget(toolbar)
 
-        # Get absolute path to icon
-        icon_path_bath = os.path.join(os.path.dirname(__file__), "icons")
-
         new_text_btn = QAction(
-            QIcon(f"{os.path.join(icon_path_bath, 'plus.png')}"),
+            _icon("plus.png"),
             "Add New Text",
             self,
         )
@@ -55,7 +67,7 @@ class StoryEditorParentWindow(QWidget):
         toolbar.addAction(new_text_btn)
 
         refresh_btn = QAction(
-            QIcon(f"{os.path.join(icon_path_bath, 'refresh.png')}"),
+            _icon("refresh.png"),
             "Refresh from Krita document",
             self,
         )
@@ -65,7 +77,7 @@ class StoryEditorParentWindow(QWidget):
         toolbar.addAction(refresh_btn)
 
         save_btn = QAction(
-            QIcon(f"{os.path.join(icon_path_bath, 'disk.png')}"),
+            _icon("disk.png"),
             "Save All Opened Documents",
             self,
         )
@@ -74,7 +86,7 @@ class StoryEditorParentWindow(QWidget):
         toolbar.addAction(save_btn)
 
         update_btn = QAction(
-            QIcon(f"{os.path.join(icon_path_bath, 'update_krita.png')}"),
+            _icon("update_krita.png"),
             "Update Krita",
             self,
         )
@@ -85,7 +97,7 @@ class StoryEditorParentWindow(QWidget):
 
         # Find/Replace button
         find_replace_btn = QAction(
-            QIcon(f"{os.path.join(icon_path_bath, 'search.png')}"),
+            _icon("search.png"),
             "Find/Replace",
             self,
         )
@@ -95,7 +107,7 @@ class StoryEditorParentWindow(QWidget):
 
         # Story Board button
         story_board_btn = QAction(
-            QIcon(f"{os.path.join(icon_path_bath, 'board.png')}"),
+            _icon("board.png"),
             "Story Board",
             self,
         )
@@ -105,14 +117,12 @@ class StoryEditorParentWindow(QWidget):
 
         # Add spacer to push pin button to the right
         spacer = QWidget()
-        spacer.setSizePolicy(
-            QWidget().sizePolicy().Expanding, QWidget().sizePolicy().Preferred
-        )
+        spacer.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Preferred)
         toolbar.addWidget(spacer)
 
         # Pin button to keep window on top
         self.pin_btn = QAction(
-            QIcon(f"{os.path.join(icon_path_bath, 'thumbtack_light.png')}"),
+            _icon("thumbtack_light.png"),
             "Pin Window on Top",
             self,
         )
@@ -136,13 +146,11 @@ class StoryEditorParentWindow(QWidget):
 
         # Add spacer to push buttons to the right
         spacer_bottom = QWidget()
-        spacer_bottom.setSizePolicy(
-            QWidget().sizePolicy().Expanding, QWidget().sizePolicy().Preferred
-        )
+        spacer_bottom.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Preferred)
         bottom_layout.addWidget(spacer_bottom)
 
         scroll_top_btn = QAction(
-            QIcon(f"{os.path.join(icon_path_bath, 'arrow_up.png')}"),
+            _icon("arrow_up.png"),
             "Scroll to Top",
             self,
         )
@@ -150,7 +158,7 @@ class StoryEditorParentWindow(QWidget):
             lambda: self.story_editor_handler.scroll_to_top()
         )
         scroll_bottom_btn = QAction(
-            QIcon(f"{os.path.join(icon_path_bath, 'arrow_down.png')}"),
+            _icon("arrow_down.png"),
             "Scroll to Bottom",
             self,
         )
@@ -167,30 +175,33 @@ class StoryEditorParentWindow(QWidget):
         """Toggle window always-on-top state"""
         # Get current window flags
         flags = self.windowFlags()
-
-        # Get icon path
-        icon_path_bath = os.path.join(os.path.dirname(__file__), "icons")
-
         if checked:
             # Add WindowStaysOnTopHint flag
-            self.setWindowFlags(flags | Qt.WindowStaysOnTopHint)
+            flags |= Qt.WindowStaysOnTopHint
+        else:
+            # Remove WindowStaysOnTopHint flag
+            flags &= ~Qt.WindowStaysOnTopHint
+
+        window_handle = self.windowHandle()
+        if window_handle is not None and self.isVisible():
+            # Update the existing native window; setWindowFlags() would
+            # recreate it and show it again with a full relayout
+            self.overrideWindowFlags(flags)
+            window_handle.setFlags(flags)
+        else:
+            self.setWindowFlags(flags)
+            # Need to show the window again after changing flags
+            self.show()
+
+        if checked:
             # Change icon to dark thumbtack
-            self.pin_btn.setIcon(
-                QIcon(os.path.join(icon_path_bath, "thumbtack_dark.png"))
-            )
+            self.pin_btn.setIcon(_icon("thumbtack_dark.png"))
             self.story_editor_handler.socket_handler.log(
                 "📌 Story Editor window pinned on top"
             )
         else:
-            # Remove WindowStaysOnTopHint flag
-            self.setWindowFlags(flags & ~Qt.WindowStaysOnTopHint)
             # Change icon back to light thumbtack
-            self.pin_btn.setIcon(
-                QIcon(os.path.join(icon_path_bath, "thumbtack_light.png"))
-            )
+            self.pin_btn.setIcon(_icon("thumbtack_light.png"))
             self.story_editor_handler.socket_handler.log(
                 "📌 Story Editor window unpinned"
             )
-
-        # Need to show the window again after changing flags
-        self.show()
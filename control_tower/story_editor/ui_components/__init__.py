@@ -16,16 +16,27 @@ from story_editor.ui_components.scroll_areas import (
     create_content_scroll_area,
 )
 from story_editor.ui_components.thumbnail import (
+    ThumbnailEventFilter,
     create_thumbnail_label,
     create_document_status_label,
     setup_thumbnail_context_menu,
+    set_thumbnail_image,
+    set_thumbnail_active,
 )
 from story_editor.ui_components.document import (
     create_activate_button,
     create_document_section,
     create_thumbnail_section,
+    populate_document,
+    populate_visible_documents,
+    release_distant_documents,
+    update_documents_in_place,
 )
 from story_editor.ui_components.text_editor import (
+    EditorModificationTracker,
+    LayerChange,
+    LayerMeta,
+    TextEditWidget,
     create_text_editor_widget,
     populate_layer_editors,
 )
@@ -35,14 +46,25 @@ __all__ = [
     "create_thumbnail_scroll_area",
     "create_content_scroll_area",
     # Thumbnails
+    "ThumbnailEventFilter",
     "create_thumbnail_label",
     "create_document_status_label",
     "setup_thumbnail_context_menu",
+    "set_thumbnail_image",
+    "set_thumbnail_active",
     # Documents
     "create_activate_button",
     "create_document_section",
     "create_thumbnail_section",
+    "populate_document",
+    "populate_visible_documents",
+    "release_distant_documents",
+    "update_documents_in_place",
     # Text editors
+    "EditorModificationTracker",
+    "LayerChange",
+    "LayerMeta",
+    "TextEditWidget",
     "create_text_editor_widget",
     "populate_layer_editors",
 ]
@@ -11,7 +11,13 @@ Data Flow:
    - Thumbnail section (via create_thumbnail_section)
    - Activate button (via create_activate_button)
    - Document state (via _initialize_document_state)
-   - Text editors for all layers (via populate_layer_editors)
+   - Text editors for all layers (via populate_layer_editors), deferred until
+     the section scrolls near the viewport (see populate_visible_documents)
+     and released again once it is far away and unedited
+     (see release_distant_documents)
+4. On refresh, update_documents_in_place() patches the changed texts (and
+   the opened/offline status) of the existing sections when the structure is
+   unchanged
 
 Input Data Structure (doc_data):
 ---------------------------------
@@ -33,27 +39,40 @@ Output:
 -------
 - UI widgets added to provided layouts
 - Document state initialized in editor_window.all_docs_text_state
-- References stored in editor_window.doc_buttons and doc_thumbnails
+- References stored in editor_window.doc_buttons, doc_thumbnails and
+  doc_status_labels
 """
 
-from typing import Optional, Dict, Any
+import bisect
+from typing import Optional, Dict, Any, List
 from PyQt5.QtWidgets import (
     QWidget,
     QPushButton,
     QHBoxLayout,
     QVBoxLayout,
     QGridLayout,
+    QScrollArea,
     QSizePolicy,
 )
-from PyQt5.QtCore import Qt
 
 from story_editor.ui_components.thumbnail import (
+    DOCUMENT_STATUS_PROPERTY,
     create_thumbnail_label,
     create_document_status_label,
+    set_document_status,
+    set_thumbnail_activatable,
+    set_thumbnail_active,
     setup_thumbnail_context_menu,
 )
-from story_editor.ui_components.text_editor import populate_layer_editors
+from story_editor.ui_components.text_editor import (
+    estimate_layer_editors_height,
+    populate_layer_editors,
+    update_text_editor_text,
+)
+from story_editor.utils.svg_generator import change_plain_text
+from story_editor.utils.svg_parser import parse_krita_svg, parsed_svg_cache_key
 from config.story_editor_loader import (
+    get_tspan_editor_stylesheet,
     get_activate_button_stylesheet,
     get_activate_button_disabled_stylesheet,
     get_thumbnail_layout_settings,
@@ -67,6 +86,16 @@ THUMBNAIL_SPACING = 0
 DOC_CONTAINER_MARGINS = (5, 5, 5, 5)
 DOCUMENT_CONTAINER_BORDER_COLOR = "#333333"
 DOCUMENT_CONTAINER_BORDER_WIDTH = 2
+DOC_CONTAINER_OBJECT_NAME = "docContainer"
+# Activate buttons are named "activate::<doc_name>" for the shared click slot
+ACTIVATE_BUTTON_OBJECT_NAME_PREFIX = "activate::"
+# Unedited documents this many viewport heights away from the view are released
+RELEASE_DISTANCE_VIEWPORTS = 4
+# At most this many documents keep their editors; the least recently populated
+# unedited ones outside the view are released beyond that
+MAX_POPULATED_DOCUMENTS = 32
+# Refreshes changing more texts than this rebuild the window instead of patching it
+REFRESH_IN_PLACE_MAX_TEXT_UPDATES = 100
 
 
 def create_activate_button(
@@ -78,43 +107,61 @@ def create_activate_button(
         doc_name: Name of the document
         doc_path: Full path to the document
         opened: Whether the document is opened
-        editor_window: The StoryEditorWindow instance (for connecting signals)
+        editor_window: The StoryEditorWindow instance (owns the button group
+            whose single slot handles every activate button)
 
     Returns:
         Configured QPushButton
     """
     # Add line breaks between each character for vertical text
-    vertical_doc_name = "\n".join(f"{doc_name}".replace(".kra", ""))
+    vertical_doc_name = "\n".join(doc_name.removesuffix(".kra"))
     activate_btn = QPushButton(vertical_doc_name)
+    activate_btn.setObjectName(f"{ACTIVATE_BUTTON_OBJECT_NAME_PREFIX}{doc_name}")
+    # Styled by create_documents_stylesheet()
+    activate_btn.setProperty(
+        DOCUMENT_STATUS_PROPERTY, "opened" if opened else "offline"
+    )
     activate_btn.setFixedWidth(ACTIVATE_BUTTON_WIDTH)
     # activate_btn.setMinimumHeight(ACTIVATE_BUTTON_MIN_HEIGHT)
-
-    if not opened:
-        activate_btn.setStyleSheet(get_activate_button_disabled_stylesheet())
-        activate_btn.setEnabled(False)
-        activate_btn.setToolTip(f"Document: {doc_name} (offline)\nPath: {doc_path}")
-        activate_btn.setSizePolicy(QSizePolicy.Fixed, QSizePolicy.Expanding)
-    else:
-        activate_btn.setCheckable(True)
-        activate_btn.setToolTip(
-            f"Document: {doc_name} (click to activate)\nPath: {doc_path}"
-        )
-        activate_btn.clicked.connect(
-            lambda _checked, name=doc_name, btn=activate_btn: editor_window.activate_document(
-                name, btn
-            )
-        )
-        activate_btn.setStyleSheet(get_activate_button_stylesheet())
-        activate_btn.setSizePolicy(QSizePolicy.Fixed, QSizePolicy.Expanding)
+    activate_btn.setSizePolicy(QSizePolicy.Fixed, QSizePolicy.Expanding)
+    _set_activate_button_opened(activate_btn, doc_name, doc_path, opened, editor_window)
 
     # Store button reference
-    if not hasattr(editor_window, "doc_buttons"):
-        editor_window.doc_buttons = {}
     editor_window.doc_buttons[doc_name] = activate_btn
 
     return activate_btn
 
 
+def _set_activate_button_opened(
+    activate_btn: QPushButton,
+    doc_name: str,
+    doc_path: str,
+    opened: bool,
+    editor_window,
+) -> None:
+    """Enable an activate button for an opened document, or disable it.
+
+    Args:
+        activate_btn: Button created by create_activate_button()
+        doc_name: Name of the document
+        doc_path: Full path to the document
+        opened: Whether the document is opened
+        editor_window: The StoryEditorWindow instance
+    """
+    activate_btn.setEnabled(opened)
+    if opened:
+        activate_btn.setCheckable(True)
+        activate_btn.setToolTip(
+            f"Document: {doc_name} (click to activate)\nPath: {doc_path}"
+        )
+        editor_window.activate_button_group.addButton(activate_btn)
+    else:
+        activate_btn.setChecked(False)
+        activate_btn.setCheckable(False)
+        activate_btn.setToolTip(f"Document: {doc_name} (offline)\nPath: {doc_path}")
+        editor_window.activate_button_group.removeButton(activate_btn)
+
+
 def create_thumbnail_section(
     index: int,
     doc_name: str,
@@ -163,14 +210,36 @@ def create_thumbnail_section(
     thumbnail_status_container.setLayout(thumbnail_status_layout)
     thumbnail_layout.addWidget(thumbnail_status_container, row, col)
 
-    # Store thumbnail reference (button ref is stored in create_activate_button)
-    if not hasattr(editor_window, "doc_thumbnails"):
-        editor_window.doc_thumbnails = {}
+    # Store thumbnail references (button ref is stored in create_activate_button)
     editor_window.doc_thumbnails[doc_name] = thumbnail_label
+    editor_window.doc_status_labels[doc_name] = document_status_label
 
-    # Store button ref placeholder (will be set when button is created)
-    if not hasattr(editor_window, "doc_buttons"):
-        editor_window.doc_buttons = {}
+
+def create_documents_stylesheet() -> str:
+    """Build the stylesheet for all document sections.
+
+    It is set once on the widget holding every document section, so Qt parses
+    a single sheet instead of one per document. Rules are scoped by the
+    containers' object name; the text editor selectors are more specific than
+    the container's catch-all rule, as they were when set per container.
+    Activate buttons are selected by their document status property.
+
+    Returns:
+        Stylesheet string
+    """
+    doc_selector = f"#{DOC_CONTAINER_OBJECT_NAME}"
+    return (
+        f"{doc_selector}, {doc_selector} * {{ "
+        f"border: {DOCUMENT_CONTAINER_BORDER_WIDTH}px solid {DOCUMENT_CONTAINER_BORDER_COLOR}; "
+        "background-color: transparent; }"
+        + get_tspan_editor_stylesheet(f"{doc_selector} QTextEdit")
+        + get_activate_button_stylesheet(
+            f'QPushButton[{DOCUMENT_STATUS_PROPERTY}="opened"]'
+        )
+        + get_activate_button_disabled_stylesheet(
+            f'QPushButton[{DOCUMENT_STATUS_PROPERTY}="offline"]'
+        )
+    )
 
 
 def create_document_section(
@@ -214,40 +283,434 @@ def create_document_section(
     doc_horizontal_layout.addLayout(doc_header_layout, stretch=0)
 
     # Get and configure thumbnail for clickability if opened
-    if (
-        opened
-        and hasattr(editor_window, "doc_thumbnails")
-        and doc_name in editor_window.doc_thumbnails
-    ):
-        thumbnail_label = editor_window.doc_thumbnails[doc_name]
-        thumbnail_label.setCursor(Qt.PointingHandCursor)
-        thumbnail_label.mousePressEvent = (
-            lambda _, name=doc_name: editor_window.thumbnail_clicked(name)
-        )
+    if opened and doc_name in editor_window.doc_thumbnails:
+        set_thumbnail_activatable(editor_window.doc_thumbnails[doc_name], True)
 
-    # Create document container for layers
+    # Create document container for layers (styled by create_documents_stylesheet)
     doc_container = QWidget()
+    doc_container.setObjectName(DOC_CONTAINER_OBJECT_NAME)
     doc_level_layers_layout = QVBoxLayout(doc_container)
     doc_level_layers_layout.setContentsMargins(*DOC_CONTAINER_MARGINS)
-    doc_container.setStyleSheet(
-        f"border: {DOCUMENT_CONTAINER_BORDER_WIDTH}px solid {DOCUMENT_CONTAINER_BORDER_COLOR}; "
-        "background-color: transparent;"
-    )
 
     # Store the layout for this document
     editor_window.doc_layouts[doc_name] = doc_level_layers_layout
 
-    # Populate layer editors
+    # Layer editors are created lazily once the section nears the viewport;
+    # until then the section reserves the height they are estimated to take
+    _reserve_document_height(doc_container, svg_data, editor_window)
+    editor_window.pending_doc_populations[doc_name] = (
+        doc_container,
+        doc_path,
+        svg_data,
+    )
+
+    # Add document container to horizontal layout
+    doc_horizontal_layout.addWidget(doc_container, stretch=1)
+
+
+def populate_document(doc_name: str, editor_window) -> bool:
+    """Create the layer editors of a document whose population was deferred.
+
+    Args:
+        doc_name: Name of the document
+        editor_window: The StoryEditorWindow instance
+
+    Returns:
+        True if editors were created, False if the document was already populated
+    """
+    pending = editor_window.pending_doc_populations.pop(doc_name, None)
+    if pending is None:
+        return False
+
+    doc_container, doc_path, svg_data = pending
+    doc_level_layers_layout = editor_window.doc_layouts[doc_name]
+    # Most recently populated last (used as a set ordered by insertion)
+    editor_window.doc_population_order[doc_name] = None
     populate_layer_editors(
         doc_name,
         doc_path,
         svg_data,
         doc_level_layers_layout,
         editor_window.all_docs_text_state,
+        font=editor_window.text_editor_font,
+        parsed_svg_cache=editor_window.parsed_svg_cache,
+        font_metrics=editor_window.text_editor_font_metrics,
+        modification_tracker=editor_window.modification_tracker,
     )
+    # Layouts only show new children on the next event loop pass; show them
+    # now so the section does not collapse once the placeholder height is gone
+    for index in range(doc_level_layers_layout.count()):
+        widget = doc_level_layers_layout.itemAt(index).widget()
+        if widget is not None:
+            widget.show()
+    # Drop the placeholder height kept while the document was pending
+    doc_container.setMinimumHeight(0)
+    return True
+
+
+def _reserve_document_height(
+    doc_container: QWidget, svg_data: List[Dict[str, Any]], editor_window
+) -> None:
+    """Give a pending document section the estimated height of its editors.
 
-    # Add document container to horizontal layout
-    doc_horizontal_layout.addWidget(doc_container, stretch=1)
+    Args:
+        doc_container: The document's layer container widget
+        svg_data: The document's layer data
+        editor_window: The StoryEditorWindow instance
+    """
+    doc_level_layers_layout = doc_container.layout()
+    height = estimate_layer_editors_height(
+        svg_data,
+        editor_window.text_editor_font_metrics,
+        doc_level_layers_layout.spacing(),
+    )
+    if height:
+        margins = doc_level_layers_layout.contentsMargins()
+        height += margins.top() + margins.bottom()
+    doc_container.setMinimumHeight(height)
+
+
+def populate_visible_documents(scroll_area: QScrollArea, editor_window) -> None:
+    """Populate deferred documents that are within one screen of the viewport.
+
+    Documents are populated one at a time from the top, re-measuring the layout
+    after each one, since a populated section pushes the ones below it down.
+
+    Args:
+        scroll_area: The content scroll area holding the document sections
+        editor_window: The StoryEditorWindow instance
+    """
+    content = scroll_area.widget()
+    viewport_height = scroll_area.viewport().height()
+    scroll_value = scroll_area.verticalScrollBar().value()
+    visible_top = scroll_value - viewport_height
+    visible_bottom = scroll_value + 2 * viewport_height
+
+    # Pending documents are kept in display order, so their sections are
+    # sorted by position and the first one reaching the range is bisected
+    pending_docs = list(editor_window.pending_doc_populations.items())
+    start = 0
+    while start < len(pending_docs):
+        content.layout().activate()
+
+        index = bisect.bisect_left(
+            pending_docs,
+            visible_top,
+            lo=start,
+            key=lambda item: item[1][0].geometry().bottom(),
+        )
+        if (
+            index == len(pending_docs)
+            or pending_docs[index][1][0].geometry().top() > visible_bottom
+        ):
+            return
+        populate_document(pending_docs[index][0], editor_window)
+        start = index + 1
+
+
+def release_distant_documents(scroll_area: QScrollArea, editor_window) -> None:
+    """Release the layer editors of unedited documents far outside the viewport.
+
+    Documents more than RELEASE_DISTANCE_VIEWPORTS screens away are released,
+    and so are the least recently populated ones outside the view while more
+    than MAX_POPULATED_DOCUMENTS documents have editors.
+
+    A released document keeps its height, so the scroll position does not move,
+    and goes back to pending so it is rebuilt when it nears the viewport again.
+    The active document and documents with edits or new texts are kept.
+
+    Args:
+        scroll_area: The content scroll area holding the document sections
+        editor_window: The StoryEditorWindow instance
+    """
+    viewport_height = scroll_area.viewport().height()
+    scroll_value = scroll_area.verticalScrollBar().value()
+    keep_top = scroll_value - RELEASE_DISTANCE_VIEWPORTS * viewport_height
+    keep_bottom = scroll_value + (RELEASE_DISTANCE_VIEWPORTS + 1) * viewport_height
+    # Same range populate_visible_documents() fills; never released by count
+    visible_top = scroll_value - viewport_height
+    visible_bottom = scroll_value + 2 * viewport_height
+
+    pending = editor_window.pending_doc_populations
+    population_order = editor_window.doc_population_order
+    populated_count = len(population_order)
+    released_docs = set()
+    count_candidates = []  # (doc_name, doc_container) inside the keep range
+
+    for doc_data in editor_window.all_docs_svg_data:
+        doc_name = doc_data.get("document_name", "unknown")
+        if doc_name in pending:
+            continue
+
+        doc_state = editor_window.all_docs_text_state.get(doc_name)
+        if (
+            doc_state is None
+            or not doc_state["text_edit_widgets"]
+            or doc_state["new_text_widgets"]
+            or doc_name == editor_window.active_doc_name
+        ):
+            continue
+
+        doc_container = editor_window.doc_layouts[doc_name].parentWidget()
+        geometry = doc_container.geometry()
+        if geometry.bottom() >= keep_top and geometry.top() <= keep_bottom:
+            if geometry.bottom() < visible_top or geometry.top() > visible_bottom:
+                count_candidates.append((doc_name, doc_container))
+            continue
+        if _document_has_edits(doc_state):
+            continue
+
+        _release_document(doc_name, doc_container, editor_window)
+        released_docs.add(doc_name)
+        populated_count -= 1
+
+    if populated_count > MAX_POPULATED_DOCUMENTS:
+        # Least recently populated first
+        rank = {doc_name: index for index, doc_name in enumerate(population_order)}
+        count_candidates.sort(key=lambda item: rank[item[0]])
+        for doc_name, doc_container in count_candidates:
+            if populated_count <= MAX_POPULATED_DOCUMENTS:
+                break
+            if _document_has_edits(editor_window.all_docs_text_state[doc_name]):
+                continue
+            _release_document(doc_name, doc_container, editor_window)
+            released_docs.add(doc_name)
+            populated_count -= 1
+
+    if not released_docs:
+        return
+
+    # Keep pending documents in display order for populate_visible_documents
+    ordered_pending = {}
+    for doc_data in editor_window.all_docs_svg_data:
+        doc_name = doc_data.get("document_name", "unknown")
+        if doc_name in pending:
+            ordered_pending[doc_name] = pending[doc_name]
+        elif doc_name in released_docs:
+            ordered_pending[doc_name] = (
+                editor_window.doc_layouts[doc_name].parentWidget(),
+                doc_data.get("document_path", "unknown"),
+                doc_data.get("svg_data", []),
+            )
+    editor_window.pending_doc_populations = ordered_pending
+
+
+def update_documents_in_place(
+    all_docs_svg_data: List[Dict[str, Any]], editor_window
+) -> bool:
+    """Apply refreshed SVG data to the current build without rebuilding it.
+
+    Possible when the documents, their layers and each layer's text shapes are
+    the same as in the current build. Only editors whose text differs from the
+    new data are updated (which also reverts unsaved edits, as a rebuild
+    would), and documents opened or closed in Krita since only have their
+    status switched. Nothing is changed when this returns False.
+
+    Args:
+        all_docs_svg_data: The newly received data, same format as doc_data items
+        editor_window: The StoryEditorWindow instance
+
+    Returns:
+        True if the data was applied, False if the window must be rebuilt
+    """
+    old_docs_svg_data = editor_window.all_docs_svg_data
+    if not old_docs_svg_data or len(old_docs_svg_data) != len(all_docs_svg_data):
+        return False
+
+    pending = editor_window.pending_doc_populations
+    text_updates = []  # (text_edit, new_text)
+    layer_updates = []  # (layer_group, svg_content, layer_shapes)
+    parsed_layers = {}  # {parsed_svg_cache_key(): parse result}
+    modified_resets = []  # QTextDocuments whose text equals the new original
+    opened_updates = []  # (doc_name, doc_path, opened)
+
+    for old_doc, new_doc in zip(old_docs_svg_data, all_docs_svg_data):
+        if any(
+            old_doc.get(key) != new_doc.get(key)
+            for key in ("document_name", "document_path")
+        ):
+            return False
+
+        doc_name = new_doc.get("document_name", "unknown")
+        doc_path = new_doc.get("document_path", "unknown")
+        opened = new_doc.get("opened", True)
+        if old_doc.get("opened", True) != opened:
+            opened_updates.append((doc_name, doc_path, opened))
+        old_layers = old_doc.get("svg_data", [])
+        new_layers = new_doc.get("svg_data", [])
+        if [layer.get("layer_id") for layer in old_layers] != [
+            layer.get("layer_id") for layer in new_layers
+        ]:
+            return False
+
+        doc_state = editor_window.all_docs_text_state[doc_name]
+        if doc_state["new_text_widgets"]:
+            return False
+        populated = doc_name not in pending
+
+        for old_layer, new_layer in zip(old_layers, new_layers):
+            layer_id = new_layer.get("layer_id", "unknown")
+            svg_content = new_layer.get("svg", "")
+            layer_group = doc_state["layer_groups"].get(layer_id)
+
+            if old_layer.get("svg", "") == svg_content:
+                layer_shapes = layer_group["layer_shapes"] if layer_group else []
+            else:
+                if not populated:
+                    # Parsed when the document is populated
+                    continue
+                parsed_svg_data = parse_krita_svg(
+                    doc_name, doc_path, layer_id, svg_content
+                )
+                parsed_layers[
+                    parsed_svg_cache_key(doc_name, layer_id, svg_content)
+                ] = parsed_svg_data
+                layer_shapes = parsed_svg_data["layer_shapes"]
+
+                old_shape_ids = (
+                    [change.shape_id for change in layer_group["changes"]]
+                    if layer_group
+                    else []
+                )
+                if [shape["element_id"] for shape in layer_shapes] != old_shape_ids:
+                    return False
+                if layer_group:
+                    layer_updates.append((layer_group, svg_content, layer_shapes))
+
+            if not layer_group:
+                continue
+            layer_changed = old_layer.get("svg", "") != svg_content
+            for change, layer_shape in zip(layer_group["changes"], layer_shapes):
+                document = change.new_text.document()
+                if not layer_changed and not document.isModified():
+                    # Still showing the unchanged original text
+                    continue
+                if change_plain_text(change) != layer_shape["text_content"]:
+                    text_updates.append(
+                        (change.new_text, layer_shape["text_content"])
+                    )
+                else:
+                    # Matches the new original again, so it is no longer dirty
+                    modified_resets.append(document)
+
+        if len(text_updates) > REFRESH_IN_PLACE_MAX_TEXT_UPDATES:
+            return False
+
+    # Structure matches: patch the state and the changed editors
+    for layer_group, svg_content, layer_shapes in layer_updates:
+        layer_group["svg_content"] = svg_content
+        layer_group["layer_shapes"] = layer_shapes
+        for change, layer_shape in zip(layer_group["changes"], layer_shapes):
+            change.original_hash = hash(layer_shape["text_content"])
+
+    if text_updates:
+        # One repaint of the document sections for all updated editors
+        documents_container = editor_window.all_docs_scroll_area_widget.widget()
+        documents_container.setUpdatesEnabled(False)
+        try:
+            for text_edit, text in text_updates:
+                update_text_editor_text(
+                    text_edit, text, editor_window.text_editor_font_metrics
+                )
+        finally:
+            documents_container.setUpdatesEnabled(True)
+    for document in modified_resets:
+        document.setModified(False)
+    for doc_name, doc_path, opened in opened_updates:
+        _set_document_opened(doc_name, doc_path, opened, editor_window)
+
+    for doc_data in all_docs_svg_data:
+        doc_name = doc_data.get("document_name", "unknown")
+        if doc_name in pending:
+            doc_container, doc_path, _ = pending[doc_name]
+            svg_data = doc_data.get("svg_data", [])
+            pending[doc_name] = (doc_container, doc_path, svg_data)
+            _reserve_document_height(doc_container, svg_data, editor_window)
+
+    # Results of the old SVGs are left to the cache pruning of the next parse job
+    editor_window.parsed_svg_cache.update(parsed_layers)
+
+    return True
+
+
+def _set_document_opened(
+    doc_name: str, doc_path: str, opened: bool, editor_window
+) -> None:
+    """Switch an existing document section between opened and offline.
+
+    Args:
+        doc_name: Name of the document
+        doc_path: Full path to the document
+        opened: Whether the document is now opened
+        editor_window: The StoryEditorWindow instance
+    """
+    editor_window.all_docs_text_state[doc_name]["opened"] = opened
+    thumbnail_label = editor_window.doc_thumbnails[doc_name]
+    if not opened and editor_window.active_doc_name == doc_name:
+        # New text can only be added to opened documents
+        set_thumbnail_active(thumbnail_label, False)
+        editor_window.active_doc_name = None
+
+    activate_btn = editor_window.doc_buttons[doc_name]
+    _set_activate_button_opened(activate_btn, doc_name, doc_path, opened, editor_window)
+    set_document_status(activate_btn, opened)
+    set_document_status(editor_window.doc_status_labels[doc_name], opened)
+    set_thumbnail_activatable(thumbnail_label, opened)
+
+
+def _document_has_edits(doc_state: Dict[str, Any]) -> bool:
+    """Check whether any text editor of a document differs from its original text.
+
+    Args:
+        doc_state: The document's entry in all_docs_text_state
+
+    Returns:
+        True if at least one text was edited
+    """
+    for layer_group in doc_state["layer_groups"].values():
+        # setPlainText() clears the modified flag, so only editors the user
+        # typed in (or find/replace touched) can differ from their original
+        modified_changes = [
+            change
+            for change in layer_group["changes"]
+            if change.new_text.document().isModified()
+        ]
+        if not modified_changes:
+            continue
+        original_texts = {
+            layer_shape["element_id"]: layer_shape["text_content"]
+            for layer_shape in layer_group["layer_shapes"]
+        }
+        for change in modified_changes:
+            if change_plain_text(change) != original_texts.get(
+                change.shape_id, ""
+            ):
+                return True
+    return False
+
+
+def _release_document(doc_name: str, doc_container: QWidget, editor_window) -> None:
+    """Delete a document's layer editors and reset its editor state.
+
+    Args:
+        doc_name: Name of the document
+        doc_container: The document's layer container widget
+        editor_window: The StoryEditorWindow instance
+    """
+    # Keep the height the editors need; height() may include extra space the
+    # layout handed out while other sections were being populated
+    doc_container.setMinimumHeight(doc_container.minimumSizeHint().height())
+
+    doc_level_layers_layout = editor_window.doc_layouts[doc_name]
+    while doc_level_layers_layout.count():
+        widget = doc_level_layers_layout.takeAt(0).widget()
+        if widget is not None:
+            widget.deleteLater()
+
+    doc_state = editor_window.all_docs_text_state[doc_name]
+    doc_state["layer_groups"] = {}
+    doc_state["text_edit_widgets"] = []
+    editor_window.doc_population_order.pop(doc_name, None)
 
 
 def _initialize_document_state(
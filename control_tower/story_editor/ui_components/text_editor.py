@@ -6,7 +6,8 @@ Contains functions for creating text editor widgets and populating layer editors
 Data Flow:
 ----------
 1. populate_layer_editors() receives svg_data list from document
-2. For each layer, parses SVG to extract text elements
+2. For each layer, parses SVG to extract text elements (or reuses the result
+   prefetched by SvgParseJob on a worker thread)
 3. Creates QTextEdit widget for each text element
 4. Stores widgets in all_docs_text_state for tracking changes
 
@@ -28,7 +29,8 @@ Processing:
 1. SVG string → parse_krita_svg() → extracts text_content and element_id
 2. text_content → QTextEdit widget for user editing
 3. Widget stored in all_docs_text_state['doc_name']['layer_groups'][layer_id]['changes']
-4. Also stored in text_edit_widgets list for find/replace functionality
+4. Also stored as TextEditWidget records in text_edit_widgets for find/replace,
+   with the document/layer names kept in one LayerMeta shared per layer
 
 Output Structure (all_docs_text_state[doc_name]['layer_groups'][layer_id]):
 ----------------------------------------------------------------------------
@@ -38,21 +40,30 @@ Output Structure (all_docs_text_state[doc_name]['layer_groups'][layer_id]):
     'layer_shapes': [...],  # Parsed SVG shape data
     'svg_content': '<svg>...</svg>',  # Original SVG
     'changes': [
-        {
-            'new_text': QTextEdit,  # Widget containing edited text
-            'shape_id': 'shape807b_0'  # ID from SVG
-        }
+        LayerChange(
+            new_text=QTextEdit,  # Widget containing edited text
+            shape_id='shape807b_0',  # ID from SVG
+            original_hash=int,  # hash() of the original text_content
+            plain_text=(int, str),  # (revision, text) cache or None,
+                                    # see change_plain_text()
+        )
     ]
 }
 """
 
-from typing import Dict, Any, List
-from PyQt5.QtWidgets import QTextEdit, QHBoxLayout, QVBoxLayout
+from dataclasses import dataclass
+from typing import Dict, Any, List, Optional, Tuple
+from PyQt5.QtWidgets import QTextEdit, QVBoxLayout
+from PyQt5.QtCore import QObject, QEvent, pyqtSlot
+from PyQt5.QtGui import QFont, QFontMetrics
 
-from story_editor.utils.svg_parser import parse_krita_svg
+from story_editor.utils.svg_parser import (
+    parse_krita_svg,
+    parsed_svg_cache_key,
+    text_line_counts,
+)
 from config.story_editor_loader import (
     get_text_editor_font,
-    get_tspan_editor_stylesheet,
     TEXT_EDITOR_MIN_HEIGHT,
     TEXT_EDITOR_MAX_HEIGHT,
 )
@@ -61,8 +72,105 @@ from config.story_editor_loader import (
 TEXT_EDITOR_HEIGHT_PADDING = 10
 
 
+@dataclass(slots=True)
+class LayerMeta:
+    """Document and layer identity shared by every text element of a layer."""
+
+    document_name: str
+    document_path: str
+    layer_name: str
+    layer_id: str
+
+
+@dataclass(slots=True)
+class LayerChange:
+    """Editor of one text element in a layer, compared against its original."""
+
+    new_text: QTextEdit
+    shape_id: str
+    # Lets the save path skip unchanged shapes cheaply
+    original_hash: int
+    plain_text: Optional[Tuple[int, str]] = None
+
+
+@dataclass(slots=True)
+class TextEditWidget:
+    """Represents a text editor widget with metadata."""
+
+    widget: QTextEdit
+    layer_meta: LayerMeta
+    shape_id: str
+
+
+class _UndoOnFocusFilter(QObject):
+    """Enable an editor's undo/redo history the first time it gets focus.
+
+    Most editors are never edited, so their documents do not record undo
+    history until the user actually focuses them.
+    """
+
+    def eventFilter(self, obj, event):
+        if event.type() == QEvent.FocusIn:
+            enable_text_editor_undo(obj)
+        return False
+
+
+_undo_on_focus_filter = None
+
+
+class EditorModificationTracker(QObject):
+    """Collect the documents whose layer editors were modified.
+
+    One tracker serves every editor of a window; the document name is read
+    from the modified QTextDocument instead of capturing it per editor.
+    """
+
+    def __init__(self):
+        super().__init__()
+        # May still hold documents whose edits were reverted since
+        self.modified_docs = set()
+
+    @pyqtSlot(bool)
+    def on_modification_changed(self, modified: bool) -> None:
+        if modified:
+            self.modified_docs.add(self.sender().property("doc_name"))
+
+
+def enable_text_editor_undo(text_edit: QTextEdit) -> None:
+    """Enable undo/redo for an editor created by create_text_editor_widget().
+
+    Args:
+        text_edit: The text editor (already enabled editors are left as they are)
+    """
+    document = text_edit.document()
+    if not document.isUndoRedoEnabled():
+        document.setUndoRedoEnabled(True)
+        text_edit.removeEventFilter(_undo_on_focus_filter)
+
+
+def layer_tooltip_prefix(doc_name: str, layer_name: str, layer_id: str) -> str:
+    """Build the part of a text editor tooltip shared by every shape in a layer.
+
+    Args:
+        doc_name: Name of the document
+        layer_name: Name of the layer
+        layer_id: ID of the layer
+
+    Returns:
+        Tooltip text ending right before the shape ID
+    """
+    return f"Doc: {doc_name} | Layer: {layer_name} | Layer Id: {layer_id} | Shape ID: "
+
+
 def create_text_editor_widget(
-    doc_name: str, layer_name: str, layer_id: str, layer_shape: Dict[str, Any]
+    doc_name: str,
+    layer_name: str,
+    layer_id: str,
+    layer_shape: Dict[str, Any],
+    font: Optional[QFont] = None,
+    font_metrics: Optional[QFontMetrics] = None,
+    tooltip_prefix: Optional[str] = None,
+    modification_tracker: Optional[EditorModificationTracker] = None,
 ) -> QTextEdit:
     """Create a text editor widget for a text element.
 
@@ -71,39 +179,122 @@ def create_text_editor_widget(
         layer_name: Name of the layer
         layer_id: ID of the layer
         layer_shape: Shape data containing text content and element ID
+        font: Editor font shared across widgets (loaded from config if None)
+        font_metrics: Metrics for ``font`` used to estimate the initial height
+        tooltip_prefix: Tooltip text up to the shape ID, from layer_tooltip_prefix()
+        modification_tracker: Tracker to report the editor's first modification to
 
     Returns:
         Configured QTextEdit widget
     """
+    if font is None:
+        font = get_text_editor_font()
+    if font_metrics is None:
+        font_metrics = QFontMetrics(font)
+    if tooltip_prefix is None:
+        tooltip_prefix = layer_tooltip_prefix(doc_name, layer_name, layer_id)
+
     text_edit = QTextEdit()
-    text_edit.setPlainText(layer_shape["text_content"])
-    text_edit.setToolTip(
-        f"Doc: {doc_name} | Layer: {layer_name} | Layer Id: {layer_id} | "
-        f"Shape ID: {layer_shape['element_id']}"
-    )
+    text_edit.setToolTip(tooltip_prefix + str(layer_shape["element_id"]))
     text_edit.setAcceptRichText(False)
-    text_edit.setFont(get_text_editor_font())
-    text_edit.setStyleSheet(get_tspan_editor_stylesheet())
+    # Set the font before the text so the document is only laid out once
+    text_edit.setFont(font)
+    text_edit.setPlainText(layer_shape["text_content"])
+    # No undo history until the editor is first focused (see _UndoOnFocusFilter)
+    text_edit.document().setUndoRedoEnabled(False)
+    global _undo_on_focus_filter
+    if _undo_on_focus_filter is None:
+        _undo_on_focus_filter = _UndoOnFocusFilter()
+    text_edit.installEventFilter(_undo_on_focus_filter)
+    if modification_tracker is not None:
+        # Connected after setPlainText(), which leaves the document unmodified
+        document = text_edit.document()
+        document.setProperty("doc_name", doc_name)
+        document.modificationChanged.connect(
+            modification_tracker.on_modification_changed
+        )
     text_edit.setMaximumHeight(TEXT_EDITOR_MAX_HEIGHT)
-
-    # Auto-adjust height based on content
-    doc_height = text_edit.document().size().height()
     text_edit.setMinimumHeight(
-        min(
-            max(int(doc_height) + TEXT_EDITOR_HEIGHT_PADDING, TEXT_EDITOR_MIN_HEIGHT),
-            TEXT_EDITOR_MAX_HEIGHT,
-        )
+        _estimate_editor_height(layer_shape["text_content"], font_metrics)
     )
 
     return text_edit
 
 
+def update_text_editor_text(
+    text_edit: QTextEdit, text: str, font_metrics: QFontMetrics
+) -> None:
+    """Replace the text of an existing text editor and re-estimate its height.
+
+    Args:
+        text_edit: Editor created by create_text_editor_widget()
+        text: New plain text
+        font_metrics: Metrics for the editor's font
+    """
+    text_edit.setPlainText(text)
+    text_edit.setMinimumHeight(_estimate_editor_height(text, font_metrics))
+
+
+def _estimate_editor_height(text: str, font_metrics: QFontMetrics) -> int:
+    """Estimate an editor's height from its line count.
+
+    This avoids forcing a document layout pass per editor.
+
+    Args:
+        text: Plain text shown in the editor
+        font_metrics: Metrics for the editor's font
+
+    Returns:
+        Minimum height clamped to the configured editor height range
+    """
+    return _editor_height_for_lines(text.count("\n") + 1, font_metrics)
+
+
+def _editor_height_for_lines(line_count: int, font_metrics: QFontMetrics) -> int:
+    """Minimum editor height for a line count, see _estimate_editor_height()."""
+    doc_height = font_metrics.lineSpacing() * line_count
+    return min(
+        max(int(doc_height) + TEXT_EDITOR_HEIGHT_PADDING, TEXT_EDITOR_MIN_HEIGHT),
+        TEXT_EDITOR_MAX_HEIGHT,
+    )
+
+
+def estimate_layer_editors_height(
+    svg_data: List[Dict[str, Any]], font_metrics: QFontMetrics, spacing: int
+) -> int:
+    """Estimate the height of the editors populate_layer_editors() will create.
+
+    Lets a pending document section reserve its space, so the scroll range does
+    not change as sections are populated. The SVGs are scanned, not parsed.
+
+    Args:
+        svg_data: List of layer data dictionaries
+        font_metrics: Metrics for the editor font
+        spacing: Spacing between the editors in the document layout
+
+    Returns:
+        Height of the editors and the spacing between them (0 without texts)
+    """
+    heights = [
+        _editor_height_for_lines(line_count, font_metrics)
+        for layer_data in svg_data
+        for line_count in text_line_counts(layer_data.get("svg", ""))
+    ]
+    if not heights:
+        return 0
+    return sum(heights) + spacing * (len(heights) - 1)
+
+
 def populate_layer_editors(
     doc_name: str,
     doc_path: str,
     svg_data: List[Dict[str, Any]],
     doc_level_layers_layout: QVBoxLayout,
     all_docs_text_state: Dict[str, Any],
+    font: Optional[QFont] = None,
+    parsed_svg_cache: Optional[Dict[Tuple[str, str, int], Dict[str, Any]]] = None,
+    font_metrics: Optional[QFontMetrics] = None,
+    modification_tracker: Optional[EditorModificationTracker] = None,
 ) -> None:
     """Populate text editors for all layers in a document.
 
@@ -113,13 +304,36 @@ def populate_layer_editors(
         svg_data: List of layer data dictionaries
         doc_level_layers_layout: Layout to add editors to
         all_docs_text_state: Document state dictionary to update
+        font: Editor font cached by the editor window (loaded if None)
+        parsed_svg_cache: parse_krita_svg() results keyed by parsed_svg_cache_key(),
+            filled ahead of time by a background SvgParseJob
+        font_metrics: Metrics for ``font`` cached by the editor window (computed if None)
+        modification_tracker: The editor window's tracker of modified documents
     """
+    if font is None:
+        font = get_text_editor_font()
+    if font_metrics is None:
+        font_metrics = QFontMetrics(font)
+
+    # Editors are built unparented first and inserted into the layout in one
+    # batch afterwards, so construction is not interleaved with relayouts
+    text_edits = []
+
     for layer_data in svg_data:
         layer_name = layer_data.get("layer_name", "unknown")
         layer_id = layer_data.get("layer_id", "unknown")
         svg_content = layer_data.get("svg", "")
 
-        parsed_svg_data = parse_krita_svg(doc_name, doc_path, layer_id, svg_content)
+        parsed_svg_data = None
+        cache_key = parsed_svg_cache_key(doc_name, layer_id, svg_content)
+        if parsed_svg_cache is not None:
+            parsed_svg_data = parsed_svg_cache.get(cache_key)
+        if parsed_svg_data is None:
+            parsed_svg_data = parse_krita_svg(
+                doc_name, doc_path, layer_id, svg_content
+            )
+            if parsed_svg_cache is not None:
+                parsed_svg_cache[cache_key] = parsed_svg_data
 
         if not parsed_svg_data["layer_shapes"]:
             continue
@@ -132,33 +346,48 @@ def populate_layer_editors(
             "changes": [],
         }
 
+        # Metadata shared by reference by every text element of this layer
+        layer_meta = LayerMeta(doc_name, doc_path, layer_name, layer_id)
+        tooltip_prefix = layer_tooltip_prefix(doc_name, layer_name, layer_id)
+
         # Add QTextEdit for each text element
         for layer_shape in parsed_svg_data["layer_shapes"]:
-            svg_section_level_layout = QHBoxLayout()
-
             # Create text editor
             text_edit = create_text_editor_widget(
-                doc_name, layer_name, layer_id, layer_shape
+                doc_name,
+                layer_name,
+                layer_id,
+                layer_shape,
+                font,
+                font_metrics,
+                tooltip_prefix,
+                modification_tracker,
             )
 
-            svg_section_level_layout.addWidget(text_edit)
-
             all_docs_text_state[doc_name]["layer_groups"][layer_id]["changes"].append(
-                {
-                    "new_text": text_edit,
-                    "shape_id": layer_shape["element_id"],
-                }
+                LayerChange(
+                    text_edit,
+                    layer_shape["element_id"],
+                    hash(layer_shape["text_content"]),
+                )
             )
 
             # Add to text_edit_widgets list for find/replace functionality
             all_docs_text_state[doc_name]["text_edit_widgets"].append(
-                {
-                    "widget": text_edit,
-                    "document_name": doc_name,
-                    "layer_name": layer_name,
-                    "layer_id": layer_id,
-                    "shape_id": layer_shape["element_id"],
-                }
+                TextEditWidget(text_edit, layer_meta, layer_shape["element_id"])
             )
 
-            doc_level_layers_layout.addLayout(svg_section_level_layout)
+            text_edits.append(text_edit)
+
+    if not text_edits:
+        return
+
+    # Editors go straight into the document layout; a wrapper layout per shape
+    # would only add one more layout object to create and lay out per editor
+    container = doc_level_layers_layout.parentWidget()
+    container.setUpdatesEnabled(False)
+    try:
+        for text_edit in text_edits:
+            doc_level_layers_layout.addWidget(text_edit)
+    finally:
+        container.setUpdatesEnabled(True)
@@ -6,9 +6,11 @@ Contains functions for creating and configuring thumbnail-related widgets.
 Data Flow:
 ----------
 1. create_thumbnail_label() receives thumbnail data from doc_data
-2. Decodes base64 PNG image
-3. Scales to fit THUMBNAIL_LABEL_WIDTH
-4. Creates QLabel with image or placeholder
+2. Creates QLabel with a loading placeholder (or "No Preview")
+3. The editor window decodes the base64 PNG and scales it to fit
+   THUMBNAIL_LABEL_WIDTH on a worker thread (ThumbnailDecodeJob)
+4. The image is converted to a QPixmap once (and cached by the editor window)
+   and set_thumbnail_image() puts it on the label
 
 Input Data (thumbnail field from doc_data):
 --------------------------------------------
@@ -21,10 +23,10 @@ Format: Data URI with base64-encoded PNG image
 Processing:
 -----------
 1. Remove data URI prefix if present
-2. base64.b64decode() → raw image bytes
-3. QPixmap.loadFromData() → create image
-4. pixmap.scaledToWidth() → resize maintaining aspect ratio
-5. QLabel.setPixmap() → display in UI
+2. decode_base64_image() → raw image bytes       (worker thread)
+3. load_scaled_image() → decode at the label width, keeping aspect ratio,
+   converted to the pixmap storage format         (worker thread)
+4. QPixmap.fromImage() + QLabel.setPixmap() → display in UI
 
 Status Label:
 -------------
@@ -35,11 +37,10 @@ create_document_status_label() creates a vertical label showing:
 This helps users know which documents they can edit/save.
 """
 
-import base64
-from typing import Optional, Dict, Any
-from PyQt5.QtWidgets import QLabel
-from PyQt5.QtCore import QByteArray, Qt
-from PyQt5.QtGui import QPixmap
+from typing import Optional
+from PyQt5.QtWidgets import QLabel, QWidget
+from PyQt5.QtCore import Qt, QObject, QEvent, QRectF
+from PyQt5.QtGui import QColor, QPainter, QPen, QPixmap, QPixmapCache
 
 from story_editor.widgets.vertical_label import VerticalLabel
 from config.story_editor_loader import (
@@ -52,35 +53,80 @@ from config.story_editor_loader import (
 THUMBNAIL_LABEL_WIDTH, _ = get_thumbnail_layout_settings()
 DOCUMENT_STATUS_LABEL_WIDTH = 12
 THUMBNAIL_BORDER_DEFAULT = "#555"
-THUMBNAIL_BORDER_ACTIVE = "#aaa"
+THUMBNAIL_BORDER_ACTIVE = "blue"
+THUMBNAIL_ACTIVE_FRAME_WIDTH = 3
 THUMBNAIL_BACKGROUND_COLOR = "#aa805a"
+THUMBNAIL_LOADING_TEXT = "Loading\nPreview"
+THUMBNAIL_PLACEHOLDER_TEXT = "No\nPreview"
 DOCUMENT_CONTAINER_BORDER_WIDTH = 2
+# Thumbnail and status labels are styled by create_thumbnails_stylesheet()
+# through these dynamic properties, set before the labels are first polished
+THUMBNAIL_PROPERTY = "thumbnail"
+# Only set on placeholder labels; thumbnails with an image get a frame painted
+# into a cached copy of the image instead (see set_thumbnail_active())
+THUMBNAIL_HIGHLIGHTED_PROPERTY = "highlighted"
+# "opened" or "offline" (also used for the activate buttons)
+DOCUMENT_STATUS_PROPERTY = "document_status"
+# Thumbnail labels are named "thumb::<doc_name>" for ThumbnailEventFilter
+THUMBNAIL_OBJECT_NAME_PREFIX = "thumb::"
+
+
+class ThumbnailEventFilter(QObject):
+    """Handle clicks and context menus of every thumbnail label.
+
+    One filter is shared by all thumbnails; the document is read from the
+    label's object name instead of capturing it in a closure per label.
+    """
 
+    def __init__(self, editor_window):
+        super().__init__()
+        self.editor_window = editor_window
+
+    def eventFilter(self, obj, event):
+        event_type = event.type()
+        if event_type not in (QEvent.MouseButtonPress, QEvent.ContextMenu):
+            return False
+
+        doc_name = obj.objectName()[len(THUMBNAIL_OBJECT_NAME_PREFIX) :]
+        if event_type == QEvent.ContextMenu:
+            self.editor_window.show_thumbnail_context_menu(
+                event.pos(),
+                doc_name,
+                obj,
+                obj.property("doc_path"),
+                self.editor_window.comic_config_info,
+            )
+            return True
 
-def decode_base64_thumbnail(thumbnail_data: str) -> QPixmap:
-    """Decode base64 thumbnail data to QPixmap.
+        # Only thumbnails of opened documents activate on click
+        if obj.property("activatable"):
+            self.editor_window.thumbnail_clicked(doc_name)
+            return True
+        return False
 
-    Args:
-        thumbnail_data: Base64 encoded image data (with or without data URI prefix)
 
-    Returns:
-        QPixmap object with the decoded image
+def create_thumbnails_stylesheet() -> str:
+    """Build the stylesheet for all thumbnail and document status labels.
 
-    Raises:
-        Exception: If decoding fails
-    """
-    # Remove the data URI prefix if present
-    if thumbnail_data.startswith("data:image"):
-        thumbnail_data = thumbnail_data.split(",", 1)[1]
+    It is set once on the widget holding every thumbnail, so Qt parses a
+    single sheet instead of one per label.
 
-    # Decode base64 to bytes
-    image_bytes = base64.b64decode(thumbnail_data)
-
-    # Create QPixmap from bytes
-    pixmap = QPixmap()
-    pixmap.loadFromData(QByteArray(image_bytes))
-
-    return pixmap
+    Returns:
+        Stylesheet string
+    """
+    thumbnail_selector = f'QLabel[{THUMBNAIL_PROPERTY}="true"]'
+    status_selector = f"QLabel[{DOCUMENT_STATUS_PROPERTY}"
+    return (
+        f"{thumbnail_selector} {{ "
+        f"border: {DOCUMENT_CONTAINER_BORDER_WIDTH}px solid {THUMBNAIL_BORDER_DEFAULT}; "
+        f"background-color: {THUMBNAIL_BACKGROUND_COLOR}; color: #000000; }}"
+        f'{thumbnail_selector}[{THUMBNAIL_HIGHLIGHTED_PROPERTY}="true"] {{ '
+        f"border: {THUMBNAIL_ACTIVE_FRAME_WIDTH}px solid {THUMBNAIL_BORDER_ACTIVE}; }}"
+        + get_thumbnail_status_label_stylesheet(f'{status_selector}="opened"]')
+        + get_thumbnail_status_label_disabled_stylesheet(
+            f'{status_selector}="offline"]'
+        )
+    )
 
 
 def create_thumbnail_label(
@@ -88,50 +134,136 @@ def create_thumbnail_label(
 ) -> QLabel:
     """Create and configure thumbnail label for a document.
 
+    The image itself is decoded off the GUI thread and applied later with
+    set_thumbnail_image(); until then the label shows a loading placeholder.
+
     Args:
         doc_name: Name of the document
         doc_path: Full path to the document
         thumbnail: Base64 encoded thumbnail data (optional)
 
     Returns:
-        Configured QLabel with thumbnail or placeholder
+        Configured QLabel with a loading or "No Preview" placeholder
     """
     thumbnail_label = QLabel()
     thumbnail_label.setFixedWidth(THUMBNAIL_LABEL_WIDTH)
-    thumbnail_label.setStyleSheet(
-        f"border: {DOCUMENT_CONTAINER_BORDER_WIDTH}px solid {THUMBNAIL_BORDER_DEFAULT}; "
-        f"background-color: {THUMBNAIL_BACKGROUND_COLOR}; color: #000000;"
-    )
-    thumbnail_label.setProperty("default_border", THUMBNAIL_BORDER_DEFAULT)
-    thumbnail_label.setProperty("active_border", THUMBNAIL_BORDER_ACTIVE)
+    # Styled by create_thumbnails_stylesheet()
+    thumbnail_label.setProperty(THUMBNAIL_PROPERTY, True)
 
-    # Load thumbnail from base64 data if available
+    thumbnail_label.setAlignment(Qt.AlignCenter)
     if thumbnail:
-        try:
-            pixmap = decode_base64_thumbnail(thumbnail)
-
-            # Scale pixmap to width while maintaining aspect ratio
-            pixmap = pixmap.scaledToWidth(
-                THUMBNAIL_LABEL_WIDTH, Qt.SmoothTransformation
-            )
-            thumbnail_label.setPixmap(pixmap)
-            # Set label size to match the scaled pixmap
-            thumbnail_label.setFixedSize(pixmap.size())
-
-            # Set tooltip with document info
-            thumbnail_label.setToolTip(f"Document: {doc_name}\nPath: {doc_path}")
-        except Exception:
-            # If loading fails, show placeholder text
-            thumbnail_label.setText("No\nPreview")
-            thumbnail_label.setAlignment(Qt.AlignCenter)
+        # Set tooltip with document info
+        thumbnail_label.setToolTip(f"Document: {doc_name}\nPath: {doc_path}")
+        thumbnail_label.setText(THUMBNAIL_LOADING_TEXT)
     else:
         # No thumbnail available
-        thumbnail_label.setText("No\nPreview")
-        thumbnail_label.setAlignment(Qt.AlignCenter)
+        thumbnail_label.setText(THUMBNAIL_PLACEHOLDER_TEXT)
 
     return thumbnail_label
 
 
+def set_thumbnail_image(thumbnail_label: QLabel, pixmap: QPixmap) -> None:
+    """Show a decoded (already scaled) thumbnail on its label.
+
+    Args:
+        thumbnail_label: Label created by create_thumbnail_label()
+        pixmap: Decoded thumbnail, or a null QPixmap if decoding failed
+    """
+    if pixmap.isNull():
+        # If loading fails, show placeholder text
+        thumbnail_label.setText(THUMBNAIL_PLACEHOLDER_TEXT)
+        return
+
+    thumbnail_label.setProperty("thumbnail_pixmap", pixmap)
+    if thumbnail_label.property("active"):
+        # The placeholder was highlighted by the stylesheet
+        _set_thumbnail_highlighted(thumbnail_label, False)
+        thumbnail_label.setPixmap(_active_thumbnail_pixmap(pixmap))
+    else:
+        thumbnail_label.setPixmap(pixmap)
+    # Set label size to match the scaled pixmap
+    thumbnail_label.setFixedSize(pixmap.size())
+
+
+def set_thumbnail_active(thumbnail_label: QLabel, active: bool) -> None:
+    """Highlight or un-highlight the thumbnail of the active document.
+
+    Swapping between the thumbnail and a cached framed copy of it avoids
+    restyling (and re-polishing) the label on every activation.
+
+    Args:
+        thumbnail_label: Label created by create_thumbnail_label()
+        active: Whether the label's document is the active one
+    """
+    thumbnail_label.setProperty("active", active)
+
+    pixmap = thumbnail_label.property("thumbnail_pixmap")
+    if pixmap is None:
+        # Still a placeholder, which has no image to draw the frame on
+        _set_thumbnail_highlighted(thumbnail_label, active)
+        return
+
+    thumbnail_label.setPixmap(_active_thumbnail_pixmap(pixmap) if active else pixmap)
+
+
+def _set_thumbnail_highlighted(thumbnail_label: QLabel, highlighted: bool) -> None:
+    """Switch a placeholder label to or from the highlighted border.
+
+    Args:
+        thumbnail_label: Label created by create_thumbnail_label()
+        highlighted: Whether to show the highlighted border
+    """
+    thumbnail_label.setProperty(THUMBNAIL_HIGHLIGHTED_PROPERTY, highlighted)
+    _repolish(thumbnail_label)
+
+
+def _repolish(widget: QWidget) -> None:
+    """Re-evaluate a widget's property selectors after a property changed."""
+    style = widget.style()
+    style.unpolish(widget)
+    style.polish(widget)
+
+
+def _active_thumbnail_pixmap(pixmap: QPixmap) -> QPixmap:
+    """Get a copy of a thumbnail with the active frame drawn on it.
+
+    Copies are kept in QPixmapCache keyed by the source pixmap, so each
+    thumbnail is only painted once (unless the cache evicted it).
+
+    Args:
+        pixmap: Thumbnail shown by set_thumbnail_image()
+
+    Returns:
+        The framed copy
+    """
+    cache_key = f"story_editor_active_thumbnail:{pixmap.cacheKey()}"
+    framed = QPixmapCache.find(cache_key)
+    if framed is not None:
+        return framed
+
+    framed = QPixmap(pixmap)
+    pen = QPen(QColor(THUMBNAIL_BORDER_ACTIVE))
+    pen.setWidth(THUMBNAIL_ACTIVE_FRAME_WIDTH)
+    pen.setJoinStyle(Qt.MiterJoin)
+    # The label's own border covers the outer edge of the image, so the
+    # frame goes right inside it
+    inset = DOCUMENT_CONTAINER_BORDER_WIDTH + THUMBNAIL_ACTIVE_FRAME_WIDTH / 2
+    painter = QPainter(framed)
+    painter.setPen(pen)
+    painter.drawRect(
+        QRectF(
+            inset,
+            inset,
+            framed.width() - 2 * inset,
+            framed.height() - 2 * inset,
+        )
+    )
+    painter.end()
+
+    QPixmapCache.insert(cache_key, framed)
+    return framed
+
+
 def create_document_status_label(opened: bool) -> VerticalLabel:
     """Create vertical status label for a document.
 
@@ -145,33 +277,55 @@ def create_document_status_label(opened: bool) -> VerticalLabel:
     document_status_label.setFixedWidth(DOCUMENT_STATUS_LABEL_WIDTH)
     document_status_label.setContentsMargins(5, 0, 0, 0)
 
-    if opened:
-        document_status_label.setStyleSheet(get_thumbnail_status_label_stylesheet())
-    else:
-        document_status_label.setStyleSheet(
-            get_thumbnail_status_label_disabled_stylesheet()
-        )
+    # Styled by create_thumbnails_stylesheet()
+    document_status_label.setProperty(
+        DOCUMENT_STATUS_PROPERTY, "opened" if opened else "offline"
+    )
 
     return document_status_label
 
 
+def set_document_status(widget: QWidget, opened: bool) -> None:
+    """Restyle an existing status label or activate button as opened/offline.
+
+    Args:
+        widget: Label from create_document_status_label() or an activate button
+        opened: Whether the document is opened
+    """
+    widget.setProperty(DOCUMENT_STATUS_PROPERTY, "opened" if opened else "offline")
+    _repolish(widget)
+
+
+def set_thumbnail_activatable(thumbnail_label: QLabel, activatable: bool) -> None:
+    """Make clicking a thumbnail activate its document (opened documents only).
+
+    Args:
+        thumbnail_label: Label set up by setup_thumbnail_context_menu()
+        activatable: Whether a click activates the document
+    """
+    # Clicks are handled by the shared ThumbnailEventFilter
+    thumbnail_label.setProperty("activatable", activatable)
+    if activatable:
+        thumbnail_label.setCursor(Qt.PointingHandCursor)
+    else:
+        thumbnail_label.unsetCursor()
+
+
 def setup_thumbnail_context_menu(
     thumbnail_label: QLabel,
     doc_name: str,
     doc_path: str,
     editor_window,
 ) -> None:
-    """Setup context menu for thumbnail label.
+    """Setup context menu (and click handling) for thumbnail label.
 
     Args:
         thumbnail_label: The thumbnail label widget
         doc_name: Name of the document
         doc_path: Full path to the document
-        editor_window: The StoryEditorWindow instance (for accessing comic_config_info)
+        editor_window: The StoryEditorWindow instance (owns the shared
+            ThumbnailEventFilter)
     """
-    thumbnail_label.setContextMenuPolicy(Qt.CustomContextMenu)
-    thumbnail_label.customContextMenuRequested.connect(
-        lambda pos: editor_window.show_thumbnail_context_menu(
-            pos, doc_name, thumbnail_label, doc_path, editor_window.comic_config_info
-        )
-    )
+    thumbnail_label.setObjectName(f"{THUMBNAIL_OBJECT_NAME_PREFIX}{doc_name}")
+    thumbnail_label.setProperty("doc_path", doc_path)
+    thumbnail_label.installEventFilter(editor_window.thumbnail_event_filter)
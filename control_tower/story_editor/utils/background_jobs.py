@@ -0,0 +1,157 @@
+"""
+Background Jobs
+QRunnable jobs that move pure-data work off the GUI thread.
+
+Widgets must still be created on the GUI thread, so jobs only produce plain
+Python data and report completion through a QObject signal.
+"""
+
+import json
+from PyQt5.QtCore import QObject, QRunnable, pyqtSignal
+from PyQt5.QtGui import QImage
+from .image_data import decode_base64_image, load_scaled_image
+from .svg_parser import parse_krita_svg, parsed_svg_cache_key
+
+
+class SvgParseSignals(QObject):
+    """Signals emitted by SvgParseJob (QRunnable itself cannot emit)."""
+
+    finished = pyqtSignal(object)
+
+
+class SvgParseJob(QRunnable):
+    """
+    Parse the SVG of every text layer ahead of widget creation.
+
+    Results are written into a shared dict keyed by parsed_svg_cache_key() so the
+    GUI thread can pick up whatever has been parsed when it populates a
+    document, and parse the rest itself.
+    """
+
+    def __init__(self, layers, results):
+        """
+        Args:
+            layers: List of (doc_name, doc_path, layer_id, svg_content) tuples
+            results: Dict to store parse_krita_svg() results in
+        """
+        super().__init__()
+        self.layers = layers
+        self.results = results
+        self.cancelled = False
+        self.signals = SvgParseSignals()
+
+    def run(self):
+        for doc_name, doc_path, layer_id, svg_content in self.layers:
+            if self.cancelled:
+                return
+
+            key = parsed_svg_cache_key(doc_name, layer_id, svg_content)
+            if key in self.results:
+                continue
+
+            try:
+                self.results[key] = parse_krita_svg(
+                    doc_name, doc_path, layer_id, svg_content
+                )
+            except Exception:
+                # Leave it to the GUI thread, which reports the error as before
+                continue
+
+        self.signals.finished.emit(self.results)
+
+
+class ThumbnailDecodeSignals(QObject):
+    """Signals emitted by ThumbnailDecodeJob (QRunnable itself cannot emit)."""
+
+    decoded = pyqtSignal(object)
+
+
+class ThumbnailDecodeJob(QRunnable):
+    """
+    Decode and scale one document thumbnail into a QImage.
+
+    QImage (unlike QPixmap) may be used off the GUI thread, so the slot only has
+    to wrap the finished image with QPixmap.fromImage(). The image is already
+    in the format pixmaps store, so that call does not convert it again.
+    """
+
+    def __init__(self, doc_name, thumbnail_data, width):
+        """
+        Args:
+            doc_name: Name of the document the thumbnail belongs to
+            thumbnail_data: Base64 encoded image data (with or without data URI prefix)
+            width: Width to scale the image to, keeping its aspect ratio
+        """
+        super().__init__()
+        self.doc_name = doc_name
+        self.thumbnail_data = thumbnail_data
+        self.width = width
+        self.image = QImage()
+        self.cancelled = False
+        self.signals = ThumbnailDecodeSignals()
+
+    def run(self):
+        if self.cancelled:
+            return
+
+        try:
+            image = load_scaled_image(
+                decode_base64_image(self.thumbnail_data), self.width
+            )
+            if not image.isNull():
+                image = image.convertToFormat(
+                    QImage.Format_ARGB32_Premultiplied
+                    if image.hasAlphaChannel()
+                    else QImage.Format_RGB32
+                )
+            self.image = image
+        except Exception:
+            # A null image makes the label fall back to its placeholder
+            pass
+
+        if not self.cancelled:
+            self.signals.decoded.emit(self)
+
+
+def encode_request(request):
+    """
+    Serialize a socket request to compact JSON bytes.
+
+    Non-ASCII text stays escaped: requests are not framed, so the agent may
+    decode a partial read, and pure ASCII cannot split inside a character.
+    """
+    return json.dumps(request, separators=(",", ":")).encode("utf-8")
+
+
+class RequestEncodeSignals(QObject):
+    """Signals emitted by RequestEncodeJob (QRunnable itself cannot emit)."""
+
+    encoded = pyqtSignal(object)
+
+
+class RequestEncodeJob(QRunnable):
+    """
+    Serialize a socket request with encode_request().
+
+    Only the encoding runs here; the socket itself is written on the GUI thread.
+    """
+
+    def __init__(self, request):
+        """
+        Args:
+            request: Request dict of plain Python data (not modified while encoding)
+        """
+        super().__init__()
+        self.request = request
+        self.data = None
+        self.error = None
+        self.signals = RequestEncodeSignals()
+
+    def run(self):
+        try:
+            self.data = encode_request(self.request)
+        except Exception as e:
+            self.error = str(e)
+        # Only the bytes are needed from here on
+        self.request = None
+        self.signals.encoded.emit(self)
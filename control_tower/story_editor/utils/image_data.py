@@ -0,0 +1,65 @@
+"""
+Image Data
+Decoding of the base64 thumbnails sent by the Krita plugin.
+
+The stdlib binascii decoder is called directly, skipping base64.b64decode's
+wrapper.
+
+load_scaled_image() only touches QImage/QImageReader, so it is safe to call
+from worker threads.
+"""
+
+import binascii
+
+from PyQt5.QtCore import QBuffer, QByteArray, QIODevice, QSize, Qt
+from PyQt5.QtGui import QImageReader
+
+
+def decode_base64_image(thumbnail_data):
+    """
+    Decode base64 image data to raw bytes.
+
+    Args:
+        thumbnail_data: Base64 encoded image data (with or without data URI prefix)
+
+    Returns:
+        bytes: The encoded image file (e.g. PNG) contents
+    """
+    # Remove the data URI prefix if present, slicing once past the comma
+    # instead of splitting into a list of strings
+    if thumbnail_data.startswith("data:image"):
+        thumbnail_data = thumbnail_data[thumbnail_data.find(",") + 1 :]
+
+    return binascii.a2b_base64(thumbnail_data)
+
+
+def load_scaled_image(image_bytes, width):
+    """
+    Decode image file bytes straight to the given width, keeping the aspect ratio.
+
+    The reader scales while decoding, so the full-size image is never handed
+    to the caller (and never turned into a full-size QPixmap).
+
+    Args:
+        image_bytes: Encoded image file contents
+        width: Target width in pixels
+
+    Returns:
+        QImage: The scaled image, or a null QImage if decoding fails
+    """
+    buffer = QBuffer()
+    buffer.setData(QByteArray(image_bytes))
+    buffer.open(QIODevice.ReadOnly)
+
+    reader = QImageReader(buffer)
+    source_size = reader.size()
+    if source_size.isValid() and source_size.width() > 0:
+        height = max(1, round(source_size.height() * width / source_size.width()))
+        reader.setScaledSize(QSize(width, height))
+        reader.setQuality(100)
+        return reader.read()
+
+    image = reader.read()
+    if image.isNull():
+        return image
+    return image.scaledToWidth(width, Qt.SmoothTransformation)
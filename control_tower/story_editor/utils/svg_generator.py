@@ -1,4 +1,5 @@
 import xml.etree.ElementTree as ET
+import html
 import re
 from .xml_formatter import remove_namespace_prefixes
 from .svg_parser import _add_missing_namespaces
@@ -42,6 +43,31 @@ def create_new_svg_data(svg_template, shape_id, text_segment) -> str:
     return svg_data
 
 
+def change_plain_text(change) -> str:
+    """
+    Get the current plain text of a layer change's editor.
+
+    The text is cached in the change together with the editor document's
+    revision, which Qt bumps on every edit, so unedited editors are not
+    serialized again on every save.
+
+    Args:
+        change: LayerChange from a layer group's "changes" list
+
+    Returns:
+        The editor's plain text
+    """
+    document = change.new_text.document()
+    revision = document.revision()
+    cached = change.plain_text
+    if cached is not None and cached[0] == revision:
+        return cached[1]
+
+    text = change.new_text.toPlainText()
+    change.plain_text = (revision, text)
+    return text
+
+
 def update_existing_svg_data(svg_content, layer_shapes, changes) -> str:
     """
     Update existing SVG data with new text content for Krita 5.3.
@@ -60,25 +86,8 @@ def update_existing_svg_data(svg_content, layer_shapes, changes) -> str:
     style="inline-size: 152.76;text-align: left;
     text-align-last: auto;font-size: 12;white-space: pre-wrap;">Placeholder Text</text>
     """
-    import xml.etree.ElementTree as ET
-
     has_changes = False
 
-    svg_content = _add_missing_namespaces(svg_content)
-    root = ET.fromstring(svg_content)
-    namespaces = {
-        "svg": "http://www.w3.org/2000/svg",
-        "krita": "http://krita.org/namespaces/svg/krita",
-    }
-
-    # Create a mapping of shapeId to new text for quick lookup
-    shape_id_to_new_text = {}
-    for change in changes:
-        shape_id = change["shape_id"]
-        new_text_widget = change["new_text"]
-        new_text = new_text_widget.toPlainText()
-        shape_id_to_new_text[shape_id] = new_text
-
     # Create a mapping of shapeId to original text for comparison
     shape_id_to_original_text = {}
     for layer_shape in layer_shapes:
@@ -86,6 +95,32 @@ def update_existing_svg_data(svg_content, layer_shapes, changes) -> str:
         original_text = layer_shape["text_content"]
         shape_id_to_original_text[shape_id] = original_text
 
+    # Create a mapping of shapeId to new text for quick lookup
+    shape_id_to_new_text = {}
+    any_text_changed = False
+    for change in changes:
+        shape_id = change.shape_id
+        new_text = change_plain_text(change)
+        shape_id_to_new_text[shape_id] = new_text
+
+        if not any_text_changed:
+            # A differing hash means changed; an equal hash is confirmed by comparison
+            if hash(new_text) != change.original_hash:
+                any_text_changed = True
+            elif new_text != shape_id_to_original_text.get(shape_id, ""):
+                any_text_changed = True
+
+    # Nothing edited in this layer: skip parsing and rebuilding its SVG
+    if not any_text_changed:
+        return False
+
+    svg_content = _add_missing_namespaces(svg_content)
+    root = ET.fromstring(svg_content)
+    namespaces = {
+        "svg": "http://www.w3.org/2000/svg",
+        "krita": "http://krita.org/namespaces/svg/krita",
+    }
+
     # Find all text elements in the SVG and update them if needed
     text_elements = root.findall(".//svg:text", namespaces)
     # Create a list to track elements to remove (can't modify list while iterating)
@@ -146,14 +181,13 @@ def convert_text_tspans_to_elements(element):
     """Convert tspan tags stored as text into actual XML elements."""
     if element.text and "<tspan" in element.text:
         # Parse tspan tags from text
-        tspan_pattern = r"<tspan[^>]*>.*?</tspan>"
         text = element.text
 
         # Clear the original text
         element.text = None
 
         # Parse and convert to actual elements
-        parts = re.split(r"(<tspan[^>]*>.*?</tspan>)", text)
+        parts = _split_tspan_tags(text)
 
         prev_elem = element
         for part in parts:
@@ -181,6 +215,48 @@ def convert_text_tspans_to_elements(element):
         convert_text_tspans_to_elements(child)
 
 
+def _split_tspan_tags(text):
+    """
+    Split text around complete <tspan ...>...</tspan> tags.
+
+    Same result as re.split(r"(<tspan[^>]*>.*?</tspan>)", text), but scans with
+    str.find instead of a backtracking regex, so long texts stay linear.
+
+    Args:
+        text: Text that may contain serialized tspan tags
+
+    Returns:
+        List alternating plain text and tspan tag strings
+    """
+    parts = []
+    last = 0
+    search_from = 0
+
+    while True:
+        start = text.find("<tspan", search_from)
+        if start < 0:
+            break
+        open_end = text.find(">", start + 6)
+        if open_end < 0:
+            break
+        close = text.find("</tspan>", open_end + 1)
+        if close < 0:
+            break
+
+        # The regex's '.' does not cross newlines, so neither does a match here
+        if text.find("\n", open_end + 1, close) >= 0:
+            search_from = start + 1
+            continue
+
+        end = close + len("</tspan>")
+        parts.append(text[last:start])
+        parts.append(text[start:end])
+        last = search_from = end
+
+    parts.append(text[last:])
+    return parts
+
+
 def generate_full_svg_data(text_elements: list[str], svg_placeholder) -> str:
     """
     The text_elements example:
@@ -212,8 +288,6 @@ def extract_font_size(text_elem):
     Returns:
         Font size as a string with 'pt' suffix (e.g., '12pt'), or None if not found
     """
-    import re
-
     style = text_elem.get("style", "")
 
     # Look for font-size in the style attribute
@@ -243,8 +317,6 @@ def escape_text_for_svg(text):
     """
     # Escape HTML/XML entities
     # This will convert: < to &lt;, > to &gt;, & to &amp;, " to &quot;, ' to &#x27;
-    import html
-
     escaped_text = html.escape(text, quote=True)
 
     return escaped_text
@@ -1,7 +1,64 @@
 import xml.etree.ElementTree as ET
 import re
+import sys
 from .xml_formatter import remove_namespace_prefixes
-from .logs import write_log
+
+SVG_NAMESPACE = "http://www.w3.org/2000/svg"
+SVG_TEXT_TAG = f"{{{SVG_NAMESPACE}}}text"
+SVG_TSPAN_TAG = f"{{{SVG_NAMESPACE}}}tspan"
+
+# Opening <svg ...> tag, with its attributes captured for namespace checks
+SVG_OPEN_TAG_RE = re.compile(r"<svg\s+([^>]*?)>")
+# Opening <text>/<tspan> tags, with or without a namespace prefix
+TEXT_OPEN_TAG_RE = re.compile(r"<(?:\w+:)?text\b")
+TSPAN_OPEN_TAG_RE = re.compile(r"<(?:\w+:)?tspan\b")
+
+
+class _TextElementCollector:
+    """XMLParser target that builds elements for <text> subtrees only.
+
+    Everything outside a <text> element (paths, groups, defs, ...) is skipped
+    as it streams past instead of being materialized as a full DOM.
+    """
+
+    def __init__(self):
+        self.text_elements = []
+        self._builder = None
+        self._depth = 0
+
+    def start(self, tag, attrib):
+        if self._builder is None:
+            if tag != SVG_TEXT_TAG:
+                return
+            self._builder = ET.TreeBuilder()
+        self._depth += 1
+        self._builder.start(tag, attrib)
+
+    def end(self, tag):
+        if self._builder is None:
+            return
+        self._builder.end(tag)
+        self._depth -= 1
+        if self._depth == 0:
+            self.text_elements.append(self._builder.close())
+            self._builder = None
+
+    def data(self, data):
+        if self._builder is not None:
+            self._builder.data(data)
+
+    def close(self):
+        return self.text_elements
+
+
+def parsed_svg_cache_key(doc_name, layer_id, svg_content):
+    """
+    Key for caching a parse_krita_svg() result.
+
+    The content hash makes a cached result valid for as long as the layer's
+    SVG is unchanged, so results can be kept across refreshes.
+    """
+    return (doc_name, layer_id, hash(svg_content))
 
 
 def parse_krita_svg(doc_name, doc_path, layer_id, svg_content):
@@ -13,37 +70,42 @@ def parse_krita_svg(doc_name, doc_path, layer_id, svg_content):
         "layer_shapes": [],
     }
 
+    # Layers without any text element need no XML parse at all
+    if "<text" not in svg_content and ":text" not in svg_content:
+        return result
+
     # Add missing namespaces before parsing
     svg_content = _add_missing_namespaces(svg_content)
 
-    root = ET.fromstring(svg_content)
-
-    namespaces = {
-        "svg": "http://www.w3.org/2000/svg",
-        "krita": "http://krita.org/namespaces/svg/krita",
-    }
+    # Stream the document and only build the <text> subtrees
+    parser = ET.XMLParser(target=_TextElementCollector())
+    parser.feed(svg_content)
+    text_roots = parser.close()
 
-    text_elements = root.findall(".//svg:text", namespaces)
-    for text_elem in text_elements:
+    # Walk the subtrees directly with Clark-notation tags instead of compiling
+    # ElementPath queries (iter() also yields any <text> nested in another)
+    for text_elem in (
+        elem for text_root in text_roots for elem in text_root.iter(SVG_TEXT_TAG)
+    ):
         element_id = text_elem.get("id")
+        if element_id is not None:
+            # Shape IDs are compared and used as keys for as long as the
+            # editors exist, so keep one shared string per ID
+            element_id = sys.intern(element_id)
 
         # Extract text from all tspan elements
-        text_parts = []
-        tspan_elements = text_elem.findall(".//svg:tspan", namespaces)
+        tspan_elements = list(text_elem.iter(SVG_TSPAN_TAG))
         if tspan_elements:
-            for tspan in tspan_elements:
-                # print(f"before tspan_to_str: {tspan}")
-                tspan_str = tspan_to_str(tspan)
-                tspan_str = remove_namespace_prefixes(tspan_str)
-                # print(f"tspan_to_str: {tspan_str}")
-                if tspan_str:
-                    text_parts.append(tspan_str)
+            # Serialize every tspan first and clean the namespace prefixes in a
+            # single pass over the joined string instead of once per tspan
+            text_content = remove_namespace_prefixes(
+                "\n".join(
+                    ET.tostring(tspan, encoding="unicode") for tspan in tspan_elements
+                )
+            )
         else:
             # Fallback to direct text content if no tspan elements
-            if text_elem.text:
-                text_parts.append(text_elem.text)
-
-        text_content = "\n".join(text_parts)
+            text_content = text_elem.text or ""
 
         result["layer_shapes"].append(
             {"element_id": element_id, "text_content": text_content}
@@ -52,6 +114,27 @@ def parse_krita_svg(doc_name, doc_path, layer_id, svg_content):
     return result
 
 
+def text_line_counts(svg_content):
+    """
+    Count the lines of each text element's content without parsing the SVG.
+
+    parse_krita_svg() puts every <tspan> of a text element on its own line, and
+    a text without tspans is counted as one line.
+
+    Args:
+        svg_content: The layer's SVG
+
+    Returns:
+        list: Line count per text element, in document order
+    """
+    if "<text" not in svg_content and ":text" not in svg_content:
+        return []
+    return [
+        max(len(TSPAN_OPEN_TAG_RE.findall(text_chunk)), 1)
+        for text_chunk in TEXT_OPEN_TAG_RE.split(svg_content)[1:]
+    ]
+
+
 def tspan_to_str(tspan_elements):
     """
     Convert tspan elements to a serialized string format that can be reverted.
@@ -121,19 +204,22 @@ def _add_missing_namespaces(svg_content):
     This prevents 'unbound prefix' errors when SVG uses namespace prefixes
     without proper xmlns declarations.
     """
-    # Check if svg_content already has the namespaces
-    has_svg_ns = 'xmlns="http://www.w3.org/2000/svg"' in svg_content
-    has_krita_ns = 'xmlns:krita="http://krita.org/namespaces/svg/krita"' in svg_content
-    has_sodipodi_ns = (
-        'xmlns:sodipodi="http://sodipodi.sourceforge.net/DTD/sodipodi-0.dtd"'
-        in svg_content
-    )
-
     # Find the opening <svg tag
-    svg_tag_match = re.search(r"<svg\s+([^>]*?)>", svg_content)
+    svg_tag_match = SVG_OPEN_TAG_RE.search(svg_content)
     if not svg_tag_match:
         return svg_content
 
+    # Only the root tag's attributes need checking, not the whole document
+    existing_attrs = svg_tag_match.group(1)
+    has_svg_ns = 'xmlns="http://www.w3.org/2000/svg"' in existing_attrs
+    has_krita_ns = (
+        'xmlns:krita="http://krita.org/namespaces/svg/krita"' in existing_attrs
+    )
+    has_sodipodi_ns = (
+        'xmlns:sodipodi="http://sodipodi.sourceforge.net/DTD/sodipodi-0.dtd"'
+        in existing_attrs
+    )
+
     # Build the new attributes
     new_attrs = []
     if not has_svg_ns:
@@ -149,7 +235,7 @@ def _add_missing_namespaces(svg_content):
         return svg_content  # All namespaces already present
 
     # Get the existing attributes
-    existing_attrs = svg_tag_match.group(1).strip()
+    existing_attrs = existing_attrs.strip()
 
     # Combine new and existing attributes
     all_attrs = " ".join(new_attrs)
@@ -3,7 +3,6 @@ Text Update Utilities
 Handles updating existing texts and adding new texts to Krita
 """
 
-import xml.etree.ElementTree as ET
 import uuid
 import html
 from .svg_generator import (
@@ -1,6 +1,28 @@
 import xml.etree.ElementTree as ET
 import re
 
+# Patterns for the auto-generated ns0:, ns1:, ... prefixes written by ElementTree
+NS_OPEN_TAG_RE = re.compile(r"<ns\d+:")
+NS_CLOSE_TAG_RE = re.compile(r"</ns\d+:")
+NS_TEXT_VERSION_ATTR_RE = re.compile(r"\sns\d+:textVersion=")
+NS_ATTR_RE = re.compile(r"\sns\d+:(\w+)=")
+NS_XMLNS_DECL_RE = re.compile(r'\sxmlns:ns\d+="[^"]*"')
+
+
+def _has_generated_prefix(svg_string):
+    """
+    Check for an "ns<digit>" sequence with str.find instead of the regex engine.
+
+    Every pattern above needs one, so strings without it can skip all passes.
+    """
+    index = svg_string.find("ns")
+    while index >= 0:
+        next_char = svg_string[index + 2 : index + 3]
+        if next_char.isdigit():
+            return True
+        index = svg_string.find("ns", index + 2)
+    return False
+
 
 def format_svg_for_krita(svg_string):
     """
@@ -64,18 +86,21 @@ def remove_namespace_prefixes(svg_string):
     Returns:
         SVG string without namespace prefixes
     """
+    if not _has_generated_prefix(svg_string):
+        return svg_string
+
     # Remove ns0:, ns1:, etc. from tags
-    result = re.sub(r"<ns\d+:", "<", svg_string)
-    result = re.sub(r"</ns\d+:", "</", result)
+    result = NS_OPEN_TAG_RE.sub("<", svg_string)
+    result = NS_CLOSE_TAG_RE.sub("</", result)
 
     # Convert ns1:textVersion to krita:textVersion
-    result = re.sub(r"\sns\d+:textVersion=", " krita:textVersion=", result)
+    result = NS_TEXT_VERSION_ATTR_RE.sub(" krita:textVersion=", result)
 
     # Convert other ns*: attributes to krita: if needed
-    result = re.sub(r"\sns\d+:(\w+)=", r" krita:\1=", result)
+    result = NS_ATTR_RE.sub(r" krita:\1=", result)
 
     # Remove xmlns:ns* declarations
-    result = re.sub(r'\sxmlns:ns\d+="[^"]*"', "", result)
+    result = NS_XMLNS_DECL_RE.sub("", result)
 
     return result
 
@@ -108,7 +133,7 @@ def clean_svg_namespaces(svg_string):
     Returns:
         Cleaned SVG string in Krita's format
     """
-    if not svg_string:
+    if not svg_string or not _has_generated_prefix(svg_string):
         return svg_string
 
     # Step 1: Remove namespace prefixes from tags
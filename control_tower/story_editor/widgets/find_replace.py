@@ -13,9 +13,11 @@ from PyQt5.QtWidgets import (
     QCheckBox,
     QMessageBox,
 )
-from PyQt5.QtCore import Qt, QRegularExpression
+from PyQt5.QtCore import QRegularExpression
 from PyQt5.QtGui import QTextCursor
 
+from story_editor.ui_components.text_editor import enable_text_editor_undo
+
 
 class FindReplaceDialog(QDialog):
     """Dialog for finding and replacing text across all text editors"""
@@ -26,11 +28,16 @@ class FindReplaceDialog(QDialog):
 
         Args:
             parent: The parent widget
-            text_edit_widgets: List of dictionaries containing text edit widget info
-                              Each dict has 'widget', 'document_name', 'layer_name', etc.
+            text_edit_widgets: List of TextEditWidget records
+                              Each has 'widget', 'shape_id' and 'layer_meta'
+                              (shared LayerMeta with 'document_name', 'layer_name', etc.)
         """
         super().__init__(parent)
         self.text_edit_widgets = text_edit_widgets
+        # Parallel per-shape lists (same index = same shape) so the search loop
+        # only scans plain strings and touches widget records for hits only
+        self._widget_infos = [info for info in text_edit_widgets if info.widget]
+        self._widgets = [info.widget for info in self._widget_infos]
         self.current_matches = []
         self.current_match_index = -1
         self.init_ui()
@@ -171,45 +178,45 @@ class FindReplaceDialog(QDialog):
             self.status_label.setText("")
             return
 
-        for widget_info in self.text_edit_widgets:
-            widget = widget_info.get("widget")
-            if not widget:
-                continue
-
-            text = widget.toPlainText()
+        if self.use_regex_cb.isChecked():
+            # Snapshot every editor's text once, then search the plain strings
+            texts = [widget.toPlainText() for widget in self._widgets]
 
-            if self.use_regex_cb.isChecked():
-                # Use regular expression
-                flags = (
-                    0
-                    if self.case_sensitive_cb.isChecked()
-                    else QRegularExpression.CaseInsensitiveOption
-                )
-                regex = QRegularExpression(find_text)
-                if flags:
-                    regex.setPatternOptions(flags)
+            # Use regular expression (compiled once for all editors)
+            regex = QRegularExpression(find_text)
+            if not self.case_sensitive_cb.isChecked():
+                regex.setPatternOptions(QRegularExpression.CaseInsensitiveOption)
 
+            for index, text in enumerate(texts):
                 match_iter = regex.globalMatch(text)
                 while match_iter.hasNext():
                     match = match_iter.next()
-                    self.current_matches.append(
-                        {
-                            "widget": widget,
-                            "widget_info": widget_info,
-                            "start": match.capturedStart(),
-                            "length": match.capturedLength(),
-                        }
+                    self._add_match(
+                        index, match.capturedStart(), match.capturedLength()
                     )
-            else:
-                # Simple text search
-                search_text = (
-                    find_text
-                    if self.case_sensitive_cb.isChecked()
-                    else find_text.lower()
-                )
-                compare_text = (
-                    text if self.case_sensitive_cb.isChecked() else text.lower()
+        else:
+            # Simple text search
+            case_sensitive = self.case_sensitive_cb.isChecked()
+            whole_word = self.whole_word_cb.isChecked()
+            search_text = find_text if case_sensitive else find_text.lower()
+            find_length = len(find_text)
+
+            # Editors shorter than the search text cannot match, so their text
+            # is never copied out (characterCount() includes one final separator)
+            texts = [
+                (
+                    widget.toPlainText()
+                    if widget.document().characterCount() > find_length
+                    else ""
                 )
+                for widget in self._widgets
+            ]
+
+            for index, text in enumerate(texts):
+                compare_text = text if case_sensitive else text.lower()
+                # Most editors have no hit; skip them with a single C-level scan
+                if search_text not in compare_text:
+                    continue
 
                 start = 0
                 while True:
@@ -218,24 +225,17 @@ class FindReplaceDialog(QDialog):
                         break
 
                     # Check whole word option
-                    if self.whole_word_cb.isChecked():
+                    if whole_word:
                         # Check if it's a whole word
                         before_ok = pos == 0 or not text[pos - 1].isalnum()
-                        after_ok = (pos + len(find_text)) >= len(text) or not text[
-                            pos + len(find_text)
+                        after_ok = (pos + find_length) >= len(text) or not text[
+                            pos + find_length
                         ].isalnum()
                         if not (before_ok and after_ok):
                             start = pos + 1
                             continue
 
-                    self.current_matches.append(
-                        {
-                            "widget": widget,
-                            "widget_info": widget_info,
-                            "start": pos,
-                            "length": len(find_text),
-                        }
-                    )
+                    self._add_match(index, pos, find_length)
                     start = pos + 1
 
         # Update status
@@ -247,6 +247,17 @@ class FindReplaceDialog(QDialog):
                 f"Found {count} match{'es' if count != 1 else ''}"
             )
 
+    def _add_match(self, index, start, length):
+        """Record a match in the editor at ``index`` of the parallel lists"""
+        self.current_matches.append(
+            {
+                "widget": self._widgets[index],
+                "widget_info": self._widget_infos[index],
+                "start": start,
+                "length": length,
+            }
+        )
+
     def find_next(self):
         """Find and highlight the next match"""
         if not self.current_matches:
@@ -289,7 +300,7 @@ class FindReplaceDialog(QDialog):
         # Update status
         self.status_label.setText(
             f"Match {self.current_match_index + 1} of {len(self.current_matches)} "
-            f"(Document: {widget_info.get('document_name', 'unknown')})"
+            f"(Document: {widget_info.layer_meta.document_name})"
         )
 
         # Set cursor to the match position
@@ -314,7 +325,8 @@ class FindReplaceDialog(QDialog):
         widget = match["widget"]
         replace_text = self.replace_input.text()
 
-        # Replace the text
+        # Replace the text (undoable, even in editors that were never focused)
+        enable_text_editor_undo(widget)
         cursor = widget.textCursor()
         cursor.setPosition(match["start"])
         cursor.setPosition(match["start"] + match["length"], QTextCursor.KeepAnchor)
@@ -358,6 +370,7 @@ class FindReplaceDialog(QDialog):
         # Replace all matches (work backwards to avoid position shifting issues)
         for match in reversed(self.current_matches):
             widget = match["widget"]
+            enable_text_editor_undo(widget)
             cursor = widget.textCursor()
             cursor.setPosition(match["start"])
             cursor.setPosition(match["start"] + match["length"], QTextCursor.KeepAnchor)
@@ -9,7 +9,6 @@ import os
 import glob
 from config.story_editor_loader import (
     get_text_editor_font,
-    get_tspan_editor_stylesheet,
     get_template_combo_stylesheet,
     TEXT_EDITOR_MIN_HEIGHT,
     TEXT_EDITOR_MAX_HEIGHT,
@@ -26,6 +25,7 @@ def add_new_text_widget(
     doc_layouts,
     all_docs_text_state,
     socket_handler,
+    font=None,
 ):
     """
     Add a new empty text editor widget for creating new text
@@ -35,6 +35,7 @@ def add_new_text_widget(
         doc_layouts: Dictionary of document layouts {doc_name: layout}
         all_docs_text_state: Dictionary containing all document states
         socket_handler: Object with send_request and log methods
+        font: Cached editor font (loaded from config if None)
 
     Returns:
         True if widget was added successfully, False otherwise
@@ -57,8 +58,7 @@ def add_new_text_widget(
     text_edit = QTextEdit()
     text_edit.setPlainText("")
     text_edit.setPlaceholderText(placeholder_text)
-    text_edit.setFont(get_text_editor_font())
-    text_edit.setStyleSheet(get_tspan_editor_stylesheet())
+    text_edit.setFont(font if font is not None else get_text_editor_font())
     text_edit.setMaximumHeight(TEXT_EDITOR_MAX_HEIGHT)
     text_edit.setMinimumHeight(TEXT_EDITOR_MIN_HEIGHT)
 
@@ -66,6 +66,9 @@ def add_new_text_widget(
 
     template_section_layout = QVBoxLayout()
 
+    # Both combo boxes share one stylesheet string
+    combo_stylesheet = get_template_combo_stylesheet()
+
     # Create template selector combo box
     svg_template_label = QLabel("SVG Template:")
     svg_template_label.setStyleSheet(
@@ -74,7 +77,7 @@ def add_new_text_widget(
     choose_svg_template_combo = QComboBox()
     choose_svg_template_combo.setMinimumWidth(200)
     choose_svg_template_combo.setMaximumWidth(400)
-    choose_svg_template_combo.setStyleSheet(get_template_combo_stylesheet())
+    choose_svg_template_combo.setStyleSheet(combo_stylesheet)
 
     template_label = QLabel("Text Template:")
     template_label.setStyleSheet(
@@ -83,7 +86,7 @@ def add_new_text_widget(
     choose_template_combo = QComboBox()
     choose_template_combo.setMinimumWidth(200)
     choose_template_combo.setMaximumWidth(400)
-    choose_template_combo.setStyleSheet(get_template_combo_stylesheet())
+    choose_template_combo.setStyleSheet(combo_stylesheet)
 
     template_section_layout.addWidget(template_label)
     template_section_layout.addWidget(choose_template_combo)
@@ -1,21 +1,26 @@
-import base64
+import hashlib
+
 from PyQt5.QtWidgets import (
     QWidget,
     QVBoxLayout,
     QScrollArea,
     QLabel,
     QGridLayout,
-    QSizePolicy,
 )
-from PyQt5.QtCore import QByteArray, Qt
-from PyQt5.QtGui import QPixmap
+from PyQt5.QtCore import Qt, QThreadPool
+from PyQt5.QtGui import QPixmap, QPixmapCache
 from config.story_editor_loader import get_story_board_settings
+from story_editor.utils.background_jobs import ThumbnailDecodeJob
 
 STORY_BOARD_COLUMN_COUNT, STORY_BOARD_THUMBNAIL_WIDTH = get_story_board_settings()
 STORY_BOARD_WINDOW_WIDTH = (
     STORY_BOARD_THUMBNAIL_WIDTH * STORY_BOARD_COLUMN_COUNT
     + STORY_BOARD_COLUMN_COUNT * 15
 )
+# Decoded thumbnails are kept in QPixmapCache, so reopening the story board
+# does not decode unchanged thumbnails again; the cache is raised to this
+# size (KB) since full-width story board thumbnails are large
+STORY_BOARD_PIXMAP_CACHE_LIMIT = 65536
 
 
 class StoryBoardWindow(QWidget):
@@ -24,6 +29,13 @@ class StoryBoardWindow(QWidget):
     def __init__(self, all_docs_svg_data, parent=None):
         super().__init__(parent)
         self.all_docs_svg_data = all_docs_svg_data
+        # Thumbnail decodes running on worker threads
+        # {doc_name: (job, label, path, pixmap cache key)}
+        self._thumbnail_jobs = {}
+        # Set when closing cancelled decodes, leaving thumbnails unshown
+        self.thumbnails_cancelled = False
+        if QPixmapCache.cacheLimit() < STORY_BOARD_PIXMAP_CACHE_LIMIT:
+            QPixmapCache.setCacheLimit(STORY_BOARD_PIXMAP_CACHE_LIMIT)
         self.setWindowTitle("Story Board")
         self.setFixedWidth(STORY_BOARD_WINDOW_WIDTH)
         self.setStyleSheet("background-color: #2b2b2b; color: #cccccc;")
@@ -80,34 +92,29 @@ class StoryBoardWindow(QWidget):
             )
             thumbnail_label.setFixedWidth(STORY_BOARD_THUMBNAIL_WIDTH)
 
-            # Load thumbnail from base64 data if available
+            # Load thumbnail from base64 data if available; it is decoded (at
+            # the display width) on a worker thread and shown once ready
             if thumbnail:
-                try:
-                    # Remove the data URI prefix if present
-                    if thumbnail.startswith("data:image"):
-                        thumbnail_data = thumbnail.split(",", 1)[1]
-                    else:
-                        thumbnail_data = thumbnail
-
-                    # Decode base64 to bytes
-                    image_bytes = base64.b64decode(thumbnail_data)
-
-                    # Create QPixmap from bytes
-                    pixmap = QPixmap()
-                    pixmap.loadFromData(QByteArray(image_bytes))
-                    pixmap = pixmap.scaledToWidth(
-                        STORY_BOARD_THUMBNAIL_WIDTH, Qt.SmoothTransformation
+                cache_key = "story_board_thumbnail:" + hashlib.blake2b(
+                    thumbnail.encode("utf-8"), digest_size=16
+                ).hexdigest()
+                pixmap = QPixmapCache.find(cache_key)
+                if pixmap is not None:
+                    self._show_thumbnail(thumbnail_label, doc_name, doc_path, pixmap)
+                else:
+                    thumbnail_label.setText("Loading Preview")
+                    thumbnail_label.setMinimumSize(200, 150)
+                    job = ThumbnailDecodeJob(
+                        doc_name, thumbnail, STORY_BOARD_THUMBNAIL_WIDTH
                     )
-
-                    # Display original size thumbnail
-                    thumbnail_label.setPixmap(pixmap)
-                    thumbnail_label.setToolTip(
-                        f"Document: {doc_name}\nPath: {doc_path}\nSize: {pixmap.width()}x{pixmap.height()}"
+                    job.signals.decoded.connect(self._on_thumbnail_decoded)
+                    self._thumbnail_jobs[doc_name] = (
+                        job,
+                        thumbnail_label,
+                        doc_path,
+                        cache_key,
                     )
-                except Exception as e:
-                    # If loading fails, show placeholder text
-                    thumbnail_label.setText("No Preview Available")
-                    thumbnail_label.setMinimumSize(200, 150)
+                    QThreadPool.globalInstance().start(job)
             else:
                 # No thumbnail available
                 thumbnail_label.setText("No Preview Available")
@@ -136,3 +143,46 @@ class StoryBoardWindow(QWidget):
 
         # Add scroll area to main layout
         main_layout.addWidget(scroll_area)
+
+    def _on_thumbnail_decoded(self, job):
+        """Show and cache a decoded thumbnail."""
+        current_job, thumbnail_label, doc_path, cache_key = self._thumbnail_jobs.get(
+            job.doc_name, (None, None, None, None)
+        )
+        if current_job is not job:
+            return
+        del self._thumbnail_jobs[job.doc_name]
+
+        if job.image.isNull():
+            # If loading fails, show placeholder text
+            thumbnail_label.setText("No Preview Available")
+            return
+
+        pixmap = QPixmap.fromImage(job.image, Qt.NoFormatConversion)
+        QPixmapCache.insert(cache_key, pixmap)
+        thumbnail_label.setMinimumSize(0, 0)
+        self._show_thumbnail(thumbnail_label, job.doc_name, doc_path, pixmap)
+
+    def _show_thumbnail(self, thumbnail_label, doc_name, doc_path, pixmap):
+        """Display a thumbnail at its original (decoded) size."""
+        thumbnail_label.setPixmap(pixmap)
+        thumbnail_label.setToolTip(
+            f"Document: {doc_name}\nPath: {doc_path}\nSize: {pixmap.width()}x{pixmap.height()}"
+        )
+
+    def release_svg_data(self):
+        """Drop the document data the window was built from.
+
+        The shown thumbnails stay; the editor rebuilds the window the next
+        time it is requested, as it no longer matches the current data.
+        """
+        self.all_docs_svg_data = None
+
+    def closeEvent(self, event):
+        """Stop decoding thumbnails nobody will see."""
+        if self._thumbnail_jobs:
+            self.thumbnails_cancelled = True
+        for job, *_ in self._thumbnail_jobs.values():
+            job.cancelled = True
+        self._thumbnail_jobs = {}
+        super().closeEvent(event)